@@ -11,8 +11,9 @@ a = Analysis(
         ('assets\\rocky_block.png', 'assets'),
         ('src\\sprite\\Demon.json', 'src\\sprite'),
         ('src\\sprite\\Player.json', 'src\\sprite'),
+        ('src\\levels\\data\\level_1.json', 'src\\levels\\data'),
     ],
-    hiddenimports=['pygame', 'json', 'math', 'random', 'os', 'sys'],
+    hiddenimports=['pygame', 'numpy', 'json', 'math', 'random', 'os', 'sys', 'hashlib', 'struct'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
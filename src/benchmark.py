@@ -0,0 +1,349 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import pygame
+from game import Game, enable_headless
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.profiler import profiler, summarize
+from utils.asset_manager import assets
+from utils import fonts
+
+class ScriptedInput:
+    """Substituto de pygame.key.get_pressed que segue um roteiro por passo"""
+
+    def __init__(self, script):
+        self.script = script
+        self.frame = 0
+        self.pressed = set()
+
+    def __call__(self):
+        self.pressed = self.script(self.frame)
+        self.frame += 1
+        return self
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+def patrol_and_shoot(frame):
+    """Roteiro: andar para os dois lados, pular de vez em quando e atirar"""
+    pressed = {pygame.K_SPACE}
+    pressed.add(pygame.K_RIGHT if (frame // 120) % 2 == 0 else pygame.K_LEFT)
+    if frame % 90 == 0:
+        pressed.add(pygame.K_UP)
+    return pressed
+
+def make_immortal(scene):
+    """Manter a cena estável durante a medição (sem game over nem vitória)"""
+    scene.player.health = 10 ** 6
+    for enemy in scene.enemies:
+        enemy.health = 10 ** 6
+
+def spawn_demons(scene, count):
+    """Espalhar demons extras pelo level"""
+    from entities.Demon import Demon
+    spacing = (scene.level_width - 256) / max(1, count)
+    for i in range(count):
+        x = 128 + int(i * spacing)
+        y = 200 + (i % 5) * 100
+        scene.enemies.add(Demon(x, y))
+    scene.hud.set_total_enemies(scene.level.remaining_enemies())
+
+def setup_menu(game, options):
+    from scenes.MenuScene import MenuScene
+    return MenuScene(game)
+
+def setup_menu_particles(game, options):
+    """MenuScene com milhares de embers (reposição contínua)"""
+    scene = setup_menu(game, options)
+    scene.ember_emitter.emit(options.particles)
+    scene.ember_emitter.every = 1
+    scene.ember_emitter.rate = max(1, options.particles // 200)
+    return scene
+
+def setup_game(game, options):
+    from scenes.GameScene import GameScene
+    scene = GameScene(game)
+    scene.read_input = ScriptedInput(patrol_and_shoot)
+    make_immortal(scene)
+    return scene
+
+def setup_game_demons(game, options):
+    scene = setup_game(game, options)
+    spawn_demons(scene, options.demons)
+    make_immortal(scene)
+    return scene
+
+def setup_game_bullets(game, options):
+    """GameScene com a quantidade de balas reposta a cada passo"""
+    scene = setup_game(game, options)
+    rng = random.Random(options.seed)
+
+    def refill_bullets():
+        while len(scene.bullets) < options.bullets:
+            speed = rng.choice((-12, -8, 8, 12))
+            scene.bullets.spawn(rng.randrange(0, scene.level_width), rng.randrange(0, scene.level_height - 64), speed)
+
+    scene.update_phases.insert(0, ("bullets.refill", refill_bullets))
+    return scene
+
+def demon_count_scenario(count):
+    """Cenário do GameScene com exatamente `count` demons no total"""
+    def setup(game, options):
+        scene = setup_game(game, options)
+        spawn_demons(scene, max(0, count - scene.level.remaining_enemies()))
+        make_immortal(scene)
+        return scene
+    return {'name': f'demons_{count}', 'description': f'GameScene com {count} demons', 'setup': setup}
+
+def setup_game_over(game, options):
+    from scenes.GameScene import GameScene
+    scene = GameScene(game)
+    scene.read_input = ScriptedInput(lambda frame: set())
+    # Vida zerada: o primeiro passo já entra na tela de game over
+    scene.player.health = 0
+    return scene
+
+def setup_victory(game, options):
+    from scenes.VictoryScene import VictoryScene
+    return VictoryScene(game)
+
+SCENARIOS = [
+    {'name': 'menu_idle', 'description': 'MenuScene parada', 'setup': setup_menu},
+    {'name': 'menu_particles', 'description': 'MenuScene com N partículas', 'setup': setup_menu_particles},
+    {'name': 'game_level1', 'description': 'GameScene com o Level_1 padrão', 'setup': setup_game},
+    {'name': 'game_demons', 'description': 'GameScene com N demons extras', 'setup': setup_game_demons},
+    {'name': 'game_bullets', 'description': 'GameScene com N balas simultâneas', 'setup': setup_game_bullets},
+    {'name': 'game_over', 'description': 'Tela de game over (draw_game_over)', 'setup': setup_game_over},
+    {'name': 'victory', 'description': 'VictoryScene', 'setup': setup_victory},
+]
+
+def step(scene, target, timings=None):
+    """Executar um quadro da cena (eventos, update e draw)"""
+    t0 = time.perf_counter_ns()
+    scene.handle_events([])
+    t1 = time.perf_counter_ns()
+    scene.update()
+    t2 = time.perf_counter_ns()
+    scene.draw(target)
+    t3 = time.perf_counter_ns()
+
+    # A cena medida é fixa: ignorar pedidos de troca
+    scene.next_scene = None
+
+    if timings is not None:
+        timings['events'].append((t1 - t0) / 1e6)
+        timings['update'].append((t2 - t1) / 1e6)
+        timings['draw'].append((t3 - t2) / 1e6)
+        timings['frame'].append((t3 - t0) / 1e6)
+
+class SurfaceCounter:
+    """Contar as superfícies criadas enquanto ativo (pixels do SDL não passam pelo tracemalloc)
+
+    Troca temporariamente pygame.Surface, as funções de pygame.transform
+    que devolvem uma superfície nova e o render das fontes compartilhadas
+    de utils.fonts por versões que somam quantidade e bytes de pixels.
+    """
+
+    transforms = ('scale', 'smoothscale', 'flip', 'rotate', 'rotozoom', 'scale2x')
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.originals = {}
+
+    def add(self, surface):
+        self.count += 1
+        self.bytes += surface.get_pitch() * surface.get_height()
+        return surface
+
+    def take(self):
+        """Quantidade e bytes contados desde a última chamada"""
+        totals = (self.count, self.bytes)
+        self.count = 0
+        self.bytes = 0
+        return totals
+
+    def __enter__(self):
+        counter = self
+        original_surface = pygame.Surface
+
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                counter.add(self)
+
+        self.originals['Surface'] = original_surface
+        pygame.Surface = CountingSurface
+        for name in self.transforms:
+            self.originals[name] = getattr(pygame.transform, name)
+            setattr(pygame.transform, name, self.wrap_transform(self.originals[name]))
+        self.originals['fonts'] = dict(fonts._fonts)
+        for key, font in self.originals['fonts'].items():
+            fonts._fonts[key] = CountingFont(font, self)
+        return self
+
+    def __exit__(self, *exc_info):
+        pygame.Surface = self.originals['Surface']
+        for name in self.transforms:
+            setattr(pygame.transform, name, self.originals[name])
+        # Fontes carregadas durante a medição ficam como estão
+        for key, font in fonts._fonts.items():
+            if isinstance(font, CountingFont):
+                fonts._fonts[key] = font.font
+        return False
+
+    def wrap_transform(self, function):
+        def counted(*args, **kwargs):
+            result = function(*args, **kwargs)
+            # Com superfície de destino (3º argumento) não há alocação nova
+            if len(args) < 3 and 'dest_surface' not in kwargs:
+                self.add(result)
+            return result
+        return counted
+
+class CountingFont:
+    """Fonte que repassa tudo à original, contando as superfícies de render"""
+
+    def __init__(self, font, counter):
+        self.font = font
+        self.counter = counter
+
+    def render(self, *args, **kwargs):
+        return self.counter.add(self.font.render(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+def measure_allocations(scene, target, frames):
+    """Medir alocações por quadro: heap Python (tracemalloc) e superfícies criadas"""
+    alloc_kib = []
+    blocks = []
+    surfaces = []
+    surface_kib = []
+    tracemalloc.start()
+    try:
+        with SurfaceCounter() as counter:
+            for _ in range(frames):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                blocks_before = sys.getallocatedblocks()
+                step(scene, target)
+                _, peak = tracemalloc.get_traced_memory()
+                alloc_kib.append((peak - before) / 1024)
+                blocks.append(sys.getallocatedblocks() - blocks_before)
+                count, size = counter.take()
+                surfaces.append(count)
+                surface_kib.append(size / 1024)
+    finally:
+        tracemalloc.stop()
+    return {
+        'peak_kib_per_frame': summarize(alloc_kib),
+        'net_blocks_per_frame': summarize(blocks),
+        'surfaces_per_frame': summarize(surfaces),
+        'surface_kib_per_frame': summarize(surface_kib)
+    }
+
+def run_scenario(game, scenario, options):
+    random.seed(options.seed)
+    scene = scenario['setup'](game, options)
+    target = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+    # Aquecimento (caches, primeiras alocações)
+    for _ in range(options.warmup):
+        step(scene, target)
+
+    # Fases internas da cena (GameScene) vêm do profiler compartilhado
+    profiler.window = options.frames
+    profiler.reset()
+    profiler.enabled = True
+    timings = {'events': [], 'update': [], 'draw': [], 'frame': []}
+    try:
+        for _ in range(options.frames):
+            step(scene, target, timings)
+    finally:
+        profiler.enabled = False
+
+    result = {
+        'description': scenario['description'],
+        'frames': options.frames,
+        'phases_ms': {phase: summarize(values) for phase, values in timings.items()},
+        'scene_phases_ms': profiler.stats()
+    }
+    camera = getattr(scene, 'camera', None)
+    if camera is not None:
+        # Desenhados / descartados no último quadro medido
+        result['culling'] = camera.get_stats()
+    if options.alloc_frames > 0:
+        result['allocations'] = measure_allocations(scene, target, options.alloc_frames)
+    return result
+
+def parse_args(argv=None):
+    names = [scenario['name'] for scenario in SCENARIOS]
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de quadro por cenário")
+    parser.add_argument("--scenario", action="append", choices=names,
+                        help="Cenário a rodar (pode repetir; padrão: todos)")
+    parser.add_argument("--frames", type=int, default=600, help="Quadros medidos por cenário")
+    parser.add_argument("--warmup", type=int, default=60, help="Quadros de aquecimento descartados")
+    parser.add_argument("--alloc-frames", type=int, default=120,
+                        help="Quadros medidos com tracemalloc (0 desativa)")
+    parser.add_argument("--demons", type=int, default=50, help="Demons extras no cenário game_demons")
+    parser.add_argument("--bullets", type=int, default=2000, help="Balas simultâneas no cenário game_bullets")
+    parser.add_argument("--particles", type=int, default=10000, help="Partículas no cenário menu_particles")
+    parser.add_argument("--demon-scaling", type=lambda text: [int(value) for value in text.split(",")],
+                        help="Medir a escala com estas quantidades de demons (ex.: 4,16,64,256,1000)")
+    parser.add_argument("--seed", type=int, default=1234, help="Semente do random para cada cenário")
+    parser.add_argument("--output", default="benchmark_results.json", help="Arquivo JSON de saída")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    options = parse_args(argv)
+    selected = options.scenario or [scenario['name'] for scenario in SCENARIOS]
+
+    enable_headless()
+    pygame.init()
+    game = Game()
+
+    results = {}
+    for scenario in SCENARIOS:
+        if scenario['name'] not in selected:
+            continue
+        results[scenario['name']] = run_scenario(game, scenario, options)
+        frame = results[scenario['name']]['phases_ms']['frame']
+        print(f"{scenario['name']:<14} p50={frame['p50']:.2f}ms p95={frame['p95']:.2f}ms p99={frame['p99']:.2f}ms")
+
+    # Escala do tempo de quadro com o número de demons (broadphase)
+    scaling = {}
+    for count in options.demon_scaling or []:
+        scaling[str(count)] = run_scenario(game, demon_count_scenario(count), options)
+        frame = scaling[str(count)]['phases_ms']['frame']
+        pairs = scaling[str(count)]['scene_phases_ms']['check_character_collisions']
+        print(f"{count:>5} demons  frame p50={frame['p50']:.2f}ms p95={frame['p95']:.2f}ms  "
+              f"check_character_collisions p50={pairs['p50']:.3f}ms")
+    if scaling:
+        results['demon_scaling'] = scaling
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'frames': options.frames,
+            'warmup': options.warmup,
+            'seed': options.seed
+        },
+        'scenarios': results,
+        'assets': assets.get_report()
+    }
+    with open(options.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados salvos em {options.output}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
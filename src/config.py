@@ -1,4 +1,9 @@
 SCREEN_WIDTH = 1024  # 16 blocos × 64 pixels (boa proporção para visualização)
 SCREEN_HEIGHT = 768  # 12 blocos × 64 pixels
-FPS = 60
-GRAVITY = 0.5
\ No newline at end of file
+FPS = 60  # Taxa fixa da simulação (ticks de física/IA por segundo)
+GRAVITY = 0.5
+
+# Loop com passo fixo: simulação a FPS, desenho o mais rápido possível
+FIXED_TIMESTEP = True
+RENDER_FPS = 240  # Limite de quadros desenhados por segundo (0 = sem limite)
+MAX_FRAME_TIME = 250  # ms máximos acumulados por quadro (evita espiral após travadas)
\ No newline at end of file
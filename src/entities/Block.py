@@ -1,7 +1,26 @@
 import pygame
 
-class Block(pygame.sprite.Sprite):
+# Imagens de tile escaladas compartilhadas por todos os blocos: (imagem original, tamanho) -> superfície
+_tile_images = {}
+
+def get_tile_image(image, size=64):
+    """Imagem do tile no tamanho do bloco, escalada uma única vez por tipo"""
+    key = (image, size)
+    tile_image = _tile_images.get(key)
+    if tile_image is None:
+        tile_image = image if image.get_size() == (size, size) else pygame.transform.scale(image, (size, size))
+        _tile_images[key] = tile_image
+    return tile_image
+
+class Block:
+    """Registro leve de um tile sólido (flyweight)
+
+    Não é um Sprite: guarda só a posição e a imagem compartilhada do tipo,
+    que não deve ser modificada por quem a recebe.
+    """
+
+    __slots__ = ('image', 'rect')
+
     def __init__(self, image, x, y, size=64):
-        super().__init__()
-        self.image = pygame.transform.scale(image, (size, size))
-        self.rect = self.image.get_rect(topleft=(x, y))
\ No newline at end of file
+        self.image = get_tile_image(image, size)
+        self.rect = pygame.Rect(x, y, size, size)
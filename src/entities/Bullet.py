@@ -1,18 +1,16 @@
 import pygame
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, image, x, y, speed=10):
-        super().__init__()
-        self.image = pygame.transform.scale(image, (16, 16))
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
+# Imagens pré-escaladas compartilhadas por todas as balas (uma por direção)
+_bullet_images = {}
 
-    def update(self):
-        self.rect.x += self.speed
-        
-        # Remover bala se sair dos limites do level (31 colunas × 64 = 1984 pixels)
-        if self.rect.x > 1984 or self.rect.x < -16:  # Largura do level expandido ou fora pela esquerda
-            self.kill()
-        if self.rect.y > 768 or self.rect.y < -16:   # Altura do level ou fora por cima
-            self.kill()
-    
\ No newline at end of file
+def get_bullet_image(facing_right):
+    """Imagem da bala já escalada (e espelhada para a direita), criada uma única vez"""
+    image = _bullet_images.get(facing_right)
+    if image is None:
+        base = pygame.Surface((12, 4))
+        base.fill((255, 255, 0))
+        image = pygame.transform.scale(base, (16, 16))
+        if facing_right:
+            image = pygame.transform.flip(image, True, False)
+        _bullet_images[facing_right] = image
+    return image
@@ -0,0 +1,123 @@
+import numpy
+from entities.Bullet import get_bullet_image
+
+class BulletManager:
+    """Balas guardadas em arrays NumPy em vez de um sprite por bala
+
+    Posições e velocidades ficam em arrays paralelos. Movimento, saída
+    dos limites e colisão com blocos são calculados de uma vez para
+    todas as balas. Contra os inimigos o teste de sobreposição também é
+    em lote e só as balas que acertaram algo passam pelo laço em Python.
+    """
+
+    def __init__(self, bounds, size=(16, 16), capacity=64):
+        self.bounds_width, self.bounds_height = bounds
+        self.width, self.height = size
+        self.count = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Criar (ou aumentar) os arrays mantendo as balas vivas"""
+        arrays = {}
+        for name in ('x', 'y', 'vx', 'vy', 'prev_x', 'prev_y'):
+            array = numpy.zeros(capacity, dtype=numpy.float64)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            arrays[name] = array
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vx, vy=0):
+        """Criar uma bala centrada em (x, y)"""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+        i = self.count
+        self.x[i] = x - self.width // 2
+        self.y[i] = y - self.height // 2
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.prev_x[i] = self.x[i]
+        self.prev_y[i] = self.y[i]
+        self.count += 1
+
+    def remove(self, dead):
+        """Compactar os arrays descartando as balas marcadas em `dead`"""
+        if not dead.any():
+            return
+        keep = ~dead
+        alive = int(keep.sum())
+        for array in (self.x, self.y, self.vx, self.vy, self.prev_x, self.prev_y):
+            array[:alive] = array[:self.count][keep]
+        self.count = alive
+
+    def clear(self):
+        self.count = 0
+
+    def save_previous_state(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def update(self):
+        """Mover todas as balas e descartar as que saíram do level"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        self.remove((x > self.bounds_width) | (x < -self.width) |
+                    (y > self.bounds_height) | (y < -self.height))
+
+    def check_blocks(self, tile_grid):
+        """Descartar as balas que tocam algum bloco sólido"""
+        n = self.count
+        if n:
+            self.remove(tile_grid.collides_many(self.x[:n], self.y[:n], self.width, self.height))
+
+    def check_enemies(self, enemies):
+        """Aplicar dano aos inimigos atingidos e descartar as balas que acertaram"""
+        n = self.count
+        targets = list(enemies)
+        if not n or not targets:
+            return
+
+        boxes = numpy.array([enemy.rect for enemy in targets], dtype=numpy.float64)
+        x = self.x[:n, numpy.newaxis]
+        y = self.y[:n, numpy.newaxis]
+        overlap = ((x < boxes[:, 0] + boxes[:, 2]) & (x + self.width > boxes[:, 0]) &
+                   (y < boxes[:, 1] + boxes[:, 3]) & (y + self.height > boxes[:, 1]))
+
+        # Ordem das balas e dos inimigos igual à do teste um a um: um inimigo
+        # morto por uma bala não é mais atingido pelas seguintes
+        dead = numpy.zeros(n, dtype=bool)
+        for i in numpy.flatnonzero(overlap.any(axis=1)):
+            for j in numpy.flatnonzero(overlap[i]):
+                enemy = targets[j]
+                if enemy.alive():
+                    dead[i] = True
+                    enemy.take_damage(1)
+        self.remove(dead)
+
+    def draw(self, screen, camera, interpolation=1.0):
+        n = self.count
+        if not n:
+            return
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * interpolation
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * interpolation
+
+        # Só as balas dentro do retângulo visível da câmera
+        visible = camera.cull_boxes(x, y, self.width, self.height, "bullets")
+        if not visible.any():
+            return
+        camera_x, camera_y = camera.offset
+        x = (x[visible] - camera_x).astype(numpy.int64).tolist()
+        y = (y[visible] - camera_y).astype(numpy.int64).tolist()
+
+        right_image = get_bullet_image(True)
+        left_image = get_bullet_image(False)
+        images = [right_image if vx > 0 else left_image for vx in self.vx[:n][visible].tolist()]
+        screen.blits(zip(images, zip(x, y)), doreturn=False)
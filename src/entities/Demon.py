@@ -1,20 +1,35 @@
 import pygame
-import json
-import os
 from config import GRAVITY
+from utils.sprite_registry import get_sprite_data
+
+# Fallback se não encontrar o Demon.json
+DEMON_FALLBACK = {
+    "size": (128, 32),
+    "color": (150, 0, 0),  # Vermelho escuro
+    "animations": {
+        "idle": {
+            "frames": [{"x": 0, "y": 0, "width": 32, "height": 32}],
+            "frameDuration": 100
+        }
+    }
+}
 
 class Demon(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         
+        # Carregar configuração de animação
+        self.load_animation_config()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Estado inicial de um demon centrado em (x, y) (também ao reaproveitar do pool)"""
         # Inicializar atributos básicos primeiro
         self.facing_right = True
         self.current_animation = "idle"
         self.current_frame = 0
         self.frame_timer = 0
-        
-        # Carregar configuração de animação
-        self.load_animation_config()
+        self.prev_pos = None
         
         # Configurar sprite inicial
         self.animation_speed = self.animations[self.current_animation]["frameDuration"]
@@ -42,54 +57,17 @@ class Demon(pygame.sprite.Sprite):
         self.prepare_attack_timer = 0  # Timer para preparar ataque
         
     def load_animation_config(self):
-        from utils.assets_loader import get_resource_path
-        config_path = get_resource_path(os.path.join("src", "sprite", "Demon.json"))
+        # Configuração, spritesheet e frames compartilhados por todos os demons
+        sprite_data = get_sprite_data("Demon.json", (64, 64), DEMON_FALLBACK)
+        self.spritesheet = sprite_data.spritesheet
+        self.animations = sprite_data.animations
         
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            
-            # Carregar spritesheet
-            spritesheet_path = get_resource_path(os.path.join("assets", config["spriteSheet"]))
-            self.spritesheet = pygame.image.load(spritesheet_path)
-            
-            # Processar animações
-            self.animations = {}
-            for sprite_config in config["sprites"]:
-                name = sprite_config["name"]
-                self.animations[name] = {
-                    "frames": sprite_config["frames"],
-                    "frameDuration": sprite_config["frameDuration"]
-                }
-                
-        except FileNotFoundError:
-            self.spritesheet = pygame.Surface((128, 32))
-            self.spritesheet.fill((150, 0, 0))  # Vermelho escuro
-            self.animations = {
-                "idle": {
-                    "frames": [{"x": 0, "y": 0, "width": 32, "height": 32}],
-                    "frameDuration": 100
-                }
-            }
+        # Todos os frames pré-montados (64x64, olhando para os dois lados)
+        self.atlas = sprite_data.atlas
     
     def get_current_frame_image(self):
-        animation = self.animations[self.current_animation]
-        frame_data = animation["frames"][self.current_frame]
-        
-        # Extrair frame do spritesheet
-        frame_rect = pygame.Rect(frame_data["x"], frame_data["y"], 
-                                frame_data["width"], frame_data["height"])
-        frame_surface = pygame.Surface((frame_data["width"], frame_data["height"]), pygame.SRCALPHA)
-        frame_surface.blit(self.spritesheet, (0, 0), frame_rect)
-        
-        # Escalar para 64x64 para consistência
-        scaled_frame = pygame.transform.scale(frame_surface, (64, 64))
-        
-        # Flipar se necessário
-        if not self.facing_right:
-            scaled_frame = pygame.transform.flip(scaled_frame, True, False)
-            
-        return scaled_frame
+        # Espelhar quando olhando para a esquerda
+        return self.atlas.get_frame(self.current_animation, self.current_frame, not self.facing_right)
     
     def update_animation(self):
         self.frame_timer += 1
@@ -1,9 +1,23 @@
 import pygame
-import json
-import os
 
 from config import GRAVITY
-from entities.Bullet import Bullet
+from utils.sprite_registry import get_sprite_data
+
+# Fallback para uma imagem simples se não encontrar o Player.json
+PLAYER_FALLBACK = {
+    "size": (37, 57),
+    "color": (0, 100, 200),  # Azul para o player
+    "animations": {
+        "idle": {
+            "frames": [{"x": 0, "y": 0, "width": 37, "height": 57}],
+            "frameDuration": 100
+        },
+        "walk": {
+            "frames": [{"x": 0, "y": 0, "width": 37, "height": 57}],
+            "frameDuration": 80
+        }
+    }
+}
 
 class Player(pygame.sprite.Sprite):
 
@@ -43,59 +57,17 @@ class Player(pygame.sprite.Sprite):
         self.invincible_duration = 60  # 1 segundo de invencibilidade
 
     def load_animation_config(self):
-        from utils.assets_loader import get_resource_path
-        config_path = get_resource_path(os.path.join("src", "sprite", "Player.json"))
+        # Configuração, spritesheet e frames compartilhados por todas as instâncias
+        sprite_data = get_sprite_data("Player.json", (37, 57), PLAYER_FALLBACK)
+        self.spritesheet = sprite_data.spritesheet
+        self.animations = sprite_data.animations
         
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            
-            # Carregar spritesheet
-            spritesheet_path = get_resource_path(os.path.join("assets", config["spriteSheet"]))
-            self.spritesheet = pygame.image.load(spritesheet_path)
-            
-            # Processar animações
-            self.animations = {}
-            for sprite_config in config["sprites"]:
-                name = sprite_config["name"]
-                self.animations[name] = {
-                    "frames": sprite_config["frames"],
-                    "frameDuration": sprite_config["frameDuration"]
-                }
-                
-        except FileNotFoundError:
-            # Fallback para uma imagem simples se não encontrar o arquivo
-            self.spritesheet = pygame.Surface((37, 57))
-            self.spritesheet.fill((0, 100, 200))  # Azul para o player
-            self.animations = {
-                "idle": {
-                    "frames": [{"x": 0, "y": 0, "width": 37, "height": 57}],
-                    "frameDuration": 100
-                },
-                "walk": {
-                    "frames": [{"x": 0, "y": 0, "width": 37, "height": 57}],
-                    "frameDuration": 80
-                }
-            }
+        # Todos os frames pré-montados (37x57, olhando para os dois lados)
+        self.atlas = sprite_data.atlas
     
     def get_current_frame_image(self):
-        animation = self.animations[self.current_animation]
-        frame_data = animation["frames"][self.current_frame]
-        
-        # Extrair frame do spritesheet
-        frame_rect = pygame.Rect(frame_data["x"], frame_data["y"], 
-                                frame_data["width"], frame_data["height"])
-        frame_surface = pygame.Surface((frame_data["width"], frame_data["height"]), pygame.SRCALPHA)
-        frame_surface.blit(self.spritesheet, (0, 0), frame_rect)
-        
-        # Escalar para 37x57 para manter o tamanho original do player
-        scaled_frame = pygame.transform.scale(frame_surface, (37, 57))
-        
-        # Flipar se necessário (frames originais olham para a esquerda)
-        if not self.facing_left:
-            scaled_frame = pygame.transform.flip(scaled_frame, True, False)
-            
-        return scaled_frame
+        # Frames originais olham para a esquerda: espelhar quando olhando para a direita
+        return self.atlas.get_frame(self.current_animation, self.current_frame, not self.facing_left)
     
     def update_animation(self):
         self.frame_timer += 1
@@ -164,33 +136,27 @@ class Player(pygame.sprite.Sprite):
     def apply_gravity(self):
         self.speed_y += GRAVITY
 
-    def draw_muzzle_flash(self, screen, camera_x, camera_y):
+    def draw_muzzle_flash(self, screen, screen_pos):
+        """Desenhar o disparo a partir da posição do player na tela (a mesma do blit, já interpolada)"""
         if self.muzzle_flash_timer > 0:
             flash_size = 8
             flash_offset = -(self.rect.width // 2 + flash_size) if self.facing_left else (self.rect.width // 2 + flash_size)
-            flash_x = self.rect.centerx + flash_offset - camera_x
-            flash_y = self.rect.centery - camera_y
+            flash_x = screen_pos[0] + self.rect.width // 2 + flash_offset
+            flash_y = screen_pos[1] + self.rect.height // 2
             
             pygame.draw.circle(screen, (255, 255, 150), (int(flash_x), int(flash_y)), flash_size)
             pygame.draw.circle(screen, (255, 200, 0), (int(flash_x), int(flash_y)), flash_size // 2)
 
     def bullet_fire(self):
-        bullet_image = pygame.Surface((12, 4))
-        bullet_image.fill((255, 255, 0))
-        
         sprite_half_width = self.rect.width // 2
         offset_x = -(sprite_half_width + 6) if self.facing_left else (sprite_half_width + 6)
         speed = -12 if self.facing_left else 12
         
-        bullet_sprite = Bullet(bullet_image, self.rect.centerx + offset_x, self.rect.centery, speed=speed)
-        
-        if not self.facing_left:
-            bullet_sprite.image = pygame.transform.flip(bullet_sprite.image, True, False)
-        
         self.shoot_cooldown = self.shoot_delay
         self.muzzle_flash_timer = self.muzzle_flash_duration
         
-        return bullet_sprite
+        # Centro e velocidade da bala; quem cria a bala é o BulletManager
+        return (self.rect.centerx + offset_x, self.rect.centery, speed)
 
     def take_damage(self, damage):
         """Recebe dano se não estiver invencível"""
@@ -1,5 +1,6 @@
 from . import Player
 from . import Block
 from . import Bullet
+from . import BulletManager
 
-__all__ = ['Player', 'Block', 'Bullet']
\ No newline at end of file
+__all__ = ['Player', 'Block', 'Bullet', 'BulletManager']
@@ -1,20 +1,38 @@
+import os
+import time
 import pygame
 from scenes.SceneManager import SceneManager
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FIXED_TIMESTEP, RENDER_FPS, MAX_FRAME_TIME
+
+def enable_headless():
+    """Usar drivers dummy do SDL (precisa ser chamado antes de pygame.init)"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 class Game:
     def __init__(self):
+        # Mesmo sem janela é preciso um modo de vídeo para convert/convert_alpha
         self.tela = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Demon Hunter")
 
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Passo fixo da simulação em milissegundos
+        self.step_ms = 1000 / FPS
+        self.accumulator = 0.0
+        
         # Gerenciador de cenas
         self.scene_manager = SceneManager(self)
     def run(self):
         while self.running:
-            self.clock.tick(FPS)
+            if FIXED_TIMESTEP:
+                # Tempo real do quadro alimenta o acumulador da simulação
+                frame_ms = self.clock.tick(RENDER_FPS)
+                self.accumulator += min(frame_ms, MAX_FRAME_TIME)
+            else:
+                self.clock.tick(FPS)
+                self.accumulator = self.step_ms
             
             # Capturar eventos
             events = pygame.event.get()
@@ -22,13 +40,53 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
             
-            # Atualizar cena atual
+            # Atualizar cena atual em passos fixos
             self.scene_manager.handle_events(events)
-            self.scene_manager.update()
+            while self.accumulator >= self.step_ms:
+                self.scene_manager.update()
+                self.accumulator -= self.step_ms
+            
+            # Fração do próximo passo para interpolar posições no desenho
+            alpha = self.accumulator / self.step_ms if FIXED_TIMESTEP else 1.0
             
             # Desenhar cena atual
-            self.scene_manager.draw(self.tela)
+            self.scene_manager.draw(self.tela, alpha)
             pygame.display.flip()
 
-
-    
\ No newline at end of file
+    def run_headless(self, frames, draw_mode="offscreen"):
+        """Rodar um número fixo de passos sem limite de FPS e sem display.flip
+        
+        draw_mode: "offscreen" desenha numa superfície fora da tela,
+        "screen" desenha na superfície do display e "none" pula o draw.
+        Retorna estatísticas de desempenho da execução.
+        """
+        if draw_mode == "offscreen":
+            target = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        elif draw_mode == "screen":
+            target = self.tela
+        else:
+            target = None
+        
+        start = time.perf_counter()
+        frames_run = 0
+        while self.running and frames_run < frames:
+            events = pygame.event.get()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+            
+            self.scene_manager.handle_events(events)
+            self.scene_manager.update()
+            
+            if target is not None:
+                self.scene_manager.draw(target)
+            frames_run += 1
+        elapsed = time.perf_counter() - start
+        
+        return {
+            'frames': frames_run,
+            'seconds': elapsed,
+            'ticks_per_second': frames_run / elapsed if elapsed > 0 else 0.0,
+            'draw_mode': draw_mode,
+            'scene': type(self.scene_manager.current_scene).__name__
+        }
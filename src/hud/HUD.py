@@ -1,17 +1,18 @@
 import pygame
 import math
 from hud.HealthBar import HealthBar
+from utils.fonts import render_text
 
 class HUD:
     def __init__(self):
         # Inicializar componentes do HUD
         self.health_bar = HealthBar(30, 30, 250, 35, max_health=5)
         
-        # Fonts para textos gerais
-        self.title_font = pygame.font.Font(None, 28)
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.mini_font = pygame.font.Font(None, 20)
+        # Tamanhos de fonte para textos gerais (fontes vêm do registro compartilhado)
+        self.title_font_size = 28
+        self.font_size = 32
+        self.small_font_size = 24
+        self.mini_font_size = 20
         
         # Timer para animações
         self.animation_timer = 0
@@ -22,9 +23,12 @@ class HUD:
         self.text_color = (255, 255, 255)
         self.accent_color = (220, 50, 50)
         
-    def draw(self, screen, player, enemies_count=0):
+    def update(self, player):
+        """Avançar animações do HUD (chamado a cada passo da simulação)"""
         self.animation_timer += 1
+        self.health_bar.update(player.health)
         
+    def draw(self, screen, player, enemies_count=0):
         # Painel principal do HUD (canto superior esquerdo)
         self.draw_main_panel(screen, player)
         
@@ -53,7 +57,7 @@ class HUD:
         pygame.draw.rect(screen, self.border_color, (panel_x, panel_y, panel_width, panel_height), 3)
         
         # Título do painel
-        title_text = self.title_font.render("GUERREIRO", True, self.accent_color)
+        title_text = render_text("GUERREIRO", self.title_font_size, self.accent_color)
         screen.blit(title_text, (panel_x + 10, panel_y + 5))
         
         # Barra de vida melhorada (posicionada dentro do painel)
@@ -65,7 +69,7 @@ class HUD:
         if player.invincible_timer > 0:
             inv_text = "PROTEGIDO"
             inv_color = (100, 255, 100) if player.invincible_timer % 20 < 10 else (50, 200, 50)
-            inv_surface = self.small_font.render(inv_text, True, inv_color)
+            inv_surface = render_text(inv_text, self.small_font_size, inv_color)
             screen.blit(inv_surface, (panel_x + 15, panel_y + 75))
         
     def draw_enemy_panel(self, screen, enemies_count):
@@ -97,7 +101,7 @@ class HUD:
             counter_text = "ÁREA LIMPA!"
             color = (120, 255, 120)
             
-        text_surface = self.font.render(counter_text, True, color)
+        text_surface = render_text(counter_text, self.font_size, color)
         screen.blit(text_surface, (panel_x + 60, panel_y + 15))
         
         # Barra de progresso (quantos foram derrotados)
@@ -154,17 +158,17 @@ class HUD:
             ready_color = tuple(int(c * pulse) for c in weapon_color)
             pygame.draw.circle(screen, ready_color, (panel_x + 25, weapon_y + 25), 8)
             
-        weapon_surface = self.small_font.render(weapon_text, True, weapon_color)
+        weapon_surface = render_text(weapon_text, self.small_font_size, weapon_color)
         screen.blit(weapon_surface, (panel_x + 15, weapon_y))
         
         # Controles rápidos
         controls_y = panel_y + 55
-        controls_title = self.mini_font.render("CONTROLES:", True, (180, 180, 180))
+        controls_title = render_text("CONTROLES:", self.mini_font_size, (180, 180, 180))
         screen.blit(controls_title, (panel_x + 10, controls_y))
         
         controls = ["WASD/Setas: Mover", "Espaço: Atirar"]
         for i, control in enumerate(controls):
-            control_surface = self.mini_font.render(control, True, (150, 150, 150))
+            control_surface = render_text(control, self.mini_font_size, (150, 150, 150))
             screen.blit(control_surface, (panel_x + 10, controls_y + 15 + i * 15))
     
     def draw_radar_panel(self, screen, enemies_count):
@@ -201,7 +205,7 @@ class HUD:
             pygame.draw.circle(screen, (255, 100, 100), (enemy_x, enemy_y), pulse_size)
         
         # Título do radar
-        radar_title = self.mini_font.render("RADAR", True, (200, 255, 200))
+        radar_title = render_text("RADAR", self.mini_font_size, (200, 255, 200))
         title_rect = radar_title.get_rect(center=(center_x, panel_y - 10))
         screen.blit(radar_title, title_rect)
     
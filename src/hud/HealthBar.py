@@ -1,5 +1,6 @@
 import pygame
 import math
+from utils.fonts import render_text
 
 class HealthBar:
     def __init__(self, x, y, width=250, height=35, max_health=5):
@@ -22,8 +23,8 @@ class HealthBar:
         self.last_health = max_health
         self.damage_flash_timer = 0
         
-    def draw(self, screen, current_health):
-        """Desenha a barra de vida melhorada na tela"""
+    def update(self, current_health):
+        """Avança animações e detecta dano para o efeito de flash"""
         self.animation_timer += 1
         
         # Detectar dano para efeito de flash
@@ -34,6 +35,8 @@ class HealthBar:
         if self.damage_flash_timer > 0:
             self.damage_flash_timer -= 1
         
+    def draw(self, screen, current_health):
+        """Desenha a barra de vida melhorada na tela"""
         # Calcular porcentagem da vida
         health_percentage = max(0, current_health) / self.max_health
         
@@ -104,11 +107,10 @@ class HealthBar:
             pygame.draw.rect(screen, (200, 100, 100), (corner[0], corner[1], corner_size, corner_size))
         
         # Desenhar texto da vida com sombra
-        font = pygame.font.Font(None, 24)
         health_text = f"VIDA: {max(0, current_health)}/{self.max_health}"
         
         # Sombra do texto
-        shadow_surface = font.render(health_text, True, (20, 20, 20))
+        shadow_surface = render_text(health_text, 24, (20, 20, 20))
         shadow_x = self.x + (self.width - shadow_surface.get_width()) // 2 + 1
         shadow_y = self.y + (self.height - shadow_surface.get_height()) // 2 + 1
         screen.blit(shadow_surface, (shadow_x, shadow_y))
@@ -118,7 +120,7 @@ class HealthBar:
         if health_percentage <= 0.2:  # Texto vermelho quando crítico
             text_color = (255, 200, 200)
         
-        text_surface = font.render(health_text, True, text_color)
+        text_surface = render_text(health_text, 24, text_color)
         text_x = self.x + (self.width - text_surface.get_width()) // 2
         text_y = self.y + (self.height - text_surface.get_height()) // 2
         screen.blit(text_surface, (text_x, text_y))
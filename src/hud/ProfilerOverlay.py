@@ -0,0 +1,76 @@
+import pygame
+from utils.fonts import get_font, get_text_stats
+
+class ProfilerOverlay:
+    """Painel de depuração com o tempo de cada fase do quadro"""
+
+    def __init__(self, width=320, row_height=14):
+        self.width = width
+        self.row_height = row_height
+        self.budget_ms = 1000 / 60  # Orçamento de um quadro a 60 FPS
+        self.font = get_font(18)
+        self.panel_surface = None
+
+        self.text_color = (220, 220, 220)
+        self.mean_color = (100, 200, 100)
+        self.p95_color = (220, 160, 60)
+        self.border_color = (100, 50, 50)
+
+    def get_panel(self, height):
+        """Reaproveitar o fundo do painel enquanto a altura não mudar"""
+        if self.panel_surface is None or self.panel_surface.get_height() != height:
+            self.panel_surface = pygame.Surface((self.width, height), pygame.SRCALPHA)
+            self.panel_surface.fill((10, 10, 20, 200))
+        return self.panel_surface
+
+    def culling_rows(self, culling, per_row=2):
+        """Contadores de culling (desenhados/descartados), duas categorias por linha"""
+        entries = [f"{name} {drawn}/{culled}" for name, (drawn, culled) in culling.items()]
+        rows = []
+        for start in range(0, len(entries), per_row):
+            prefix = "culling: " if start == 0 else "         "
+            rows.append(prefix + "   ".join(entries[start:start + per_row]))
+        return rows
+
+    def draw(self, screen, profiler, fps=None, culling=None):
+        stats = profiler.stats()
+        culling_rows = self.culling_rows(culling) if culling else []
+        extra_rows = len(culling_rows)
+        height = (len(stats) + 3 + extra_rows) * self.row_height + 10
+        panel_x = screen.get_width() - self.width - 20
+        panel_y = screen.get_height() - height - 140
+
+        screen.blit(self.get_panel(height), (panel_x, panel_y))
+        pygame.draw.rect(screen, self.border_color, (panel_x, panel_y, self.width, height), 2)
+
+        # Cabeçalho
+        header = "PROFILER (F3)" if fps is None else f"PROFILER (F3)  {fps:.0f} FPS"
+        screen.blit(self.font.render(header, True, self.text_color), (panel_x + 8, panel_y + 5))
+        header_y = panel_y + 5 + self.row_height
+        screen.blit(self.font.render("fase", True, (150, 150, 150)), (panel_x + 8, header_y))
+        screen.blit(self.font.render("média / p95 ms", True, (150, 150, 150)), (panel_x + 160, header_y))
+
+        # Uma linha por fase: barra da média e marcador do p95 em relação ao orçamento
+        bar_x = panel_x + 240
+        bar_width = self.width - 250
+        y = panel_y + 5 + self.row_height * 2
+        for name, phase in stats.items():
+            timing = f"{phase['mean']:.2f} / {phase['p95']:.2f}"
+            screen.blit(self.font.render(name[:21], True, self.text_color), (panel_x + 8, y))
+            screen.blit(self.font.render(timing, True, self.text_color), (panel_x + 160, y))
+
+            mean_width = min(bar_width, int(bar_width * phase['mean'] / self.budget_ms))
+            p95_x = bar_x + min(bar_width, int(bar_width * phase['p95'] / self.budget_ms))
+            pygame.draw.rect(screen, self.mean_color, (bar_x, y + 3, max(1, mean_width), self.row_height - 6))
+            pygame.draw.line(screen, self.p95_color, (p95_x, y + 1), (p95_x, y + self.row_height - 2), 2)
+            y += self.row_height
+
+        # Rodapé com os contadores do cache de textos
+        text_stats = get_text_stats()
+        footer = f"cache de texto: {text_stats['hits']} acertos / {text_stats['misses']} faltas ({text_stats['entries']})"
+        screen.blit(self.font.render(footer, True, (150, 150, 150)), (panel_x + 8, y))
+        
+        # Culling da câmera: desenhados / descartados por categoria
+        for row in culling_rows:
+            y += self.row_height
+            screen.blit(self.font.render(row, True, (150, 150, 150)), (panel_x + 8, y))
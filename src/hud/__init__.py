@@ -1,4 +1,5 @@
 from . import HealthBar
 from . import HUD
+from . import ProfilerOverlay
 
-__all__ = ["HealthBar", "HUD"]
\ No newline at end of file
+__all__ = ["HealthBar", "HUD", "ProfilerOverlay"]
\ No newline at end of file
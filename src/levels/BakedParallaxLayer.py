@@ -0,0 +1,75 @@
+import math
+import pygame
+from config import SCREEN_WIDTH
+
+class BakedParallaxLayer:
+    """Camada de parallax estática pré-desenhada em segmentos
+
+    Os elementos são desenhados uma única vez em superfícies com a largura
+    da tela (segmentos), criadas na primeira vez que aparecem. No quadro
+    cada segmento visível vira um blit deslocado por camera * parallax_speed.
+
+    draw_element(surface, element, x, y) desenha um elemento na posição
+    dada e element_bounds(element) retorna o Rect que ele ocupa no mundo.
+    """
+
+    def __init__(self, elements, parallax_speed, draw_element, element_bounds, segment_width=SCREEN_WIDTH):
+        self.elements = elements
+        self.parallax_speed = parallax_speed
+        self.draw_element = draw_element
+        self.segment_width = segment_width
+
+        # Faixa ocupada pela camada (só ela vira superfície)
+        self.bounds = [element_bounds(element) for element in elements]
+        area = self.bounds[0].unionall(self.bounds[1:]) if self.bounds else pygame.Rect(0, 0, 0, 0)
+        self.left = area.left
+        self.top = area.top
+        self.width = area.width
+        self.height = area.height
+        self.segment_count = max(0, -(-self.width // segment_width))
+        self.segments = {}  # índice -> superfície (ou None se vazio)
+
+    def build_segment(self, index):
+        """Desenhar os elementos que tocam um segmento"""
+        origin_x = self.left + index * self.segment_width
+        segment_rect = pygame.Rect(origin_x, self.top, self.segment_width, self.height)
+        surface = None
+        for element, bounds in zip(self.elements, self.bounds):
+            if not segment_rect.colliderect(bounds):
+                continue
+            if surface is None:
+                surface = pygame.Surface((self.segment_width, self.height), pygame.SRCALPHA)
+            self.draw_element(surface, element, element['x'] - origin_x, element['y'] - self.top)
+
+        if surface is not None:
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            surface.set_alpha(255, pygame.RLEACCEL)
+        return surface
+
+    def get_segment(self, index):
+        if index not in self.segments:
+            self.segments[index] = self.build_segment(index)
+        return self.segments[index]
+
+    def evict(self, keep):
+        """Descartar segmentos já criados fora do conjunto `keep`"""
+        for index in list(self.segments):
+            if index not in keep:
+                del self.segments[index]
+
+    def visible_segments(self, camera_x, screen_width):
+        """Índices dos segmentos que aparecem com a câmera em camera_x"""
+        parallax_x = camera_x * self.parallax_speed
+        first = max(0, int((parallax_x - self.left) // self.segment_width))
+        last = min(self.segment_count - 1, int((parallax_x + screen_width - self.left) // self.segment_width))
+        return range(first, last + 1)
+
+    def draw(self, screen, camera_x, camera_y):
+        # Um único arredondamento para todos os segmentos (sem costuras)
+        offset_x = math.floor(camera_x * self.parallax_speed)
+        offset_y = math.floor(camera_y * self.parallax_speed)
+        for index in self.visible_segments(camera_x, screen.get_width()):
+            segment = self.get_segment(index)
+            if segment is not None:
+                screen.blit(segment, (self.left + index * self.segment_width - offset_x, self.top - offset_y))
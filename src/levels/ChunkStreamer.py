@@ -0,0 +1,48 @@
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class ChunkStreamer:
+    """Mantém ativos só os chunks do level ao redor da câmera
+
+    O level é dividido em chunks do tamanho da tela. A cada update os
+    chunks a até `margin` chunks da área visível são ativados com
+    activate(key) e os que saíram dessa área são desativados com
+    deactivate(key), sempre na ordem (linha, coluna). Assim o que existe
+    em memória depende do tamanho da tela, não do tamanho do level.
+    """
+
+    def __init__(self, level_size, activate, deactivate, chunk_size=(SCREEN_WIDTH, SCREEN_HEIGHT), margin=1):
+        self.level_width, self.level_height = level_size
+        self.chunk_width, self.chunk_height = chunk_size
+        self.cols = max(1, -(-self.level_width // self.chunk_width))
+        self.rows = max(1, -(-self.level_height // self.chunk_height))
+        self.activate = activate
+        self.deactivate = deactivate
+        self.margin = margin
+        self.active = set()  # chaves (coluna, linha) ativas
+
+    def chunk_at(self, x, y):
+        """Chunk que contém o ponto (x, y), limitado às bordas do level"""
+        col = min(self.cols - 1, max(0, int(x) // self.chunk_width))
+        row = min(self.rows - 1, max(0, int(y) // self.chunk_height))
+        return (col, row)
+
+    def keys_around(self, view, margin):
+        """Chunks que tocam o retângulo `view` expandido por `margin` chunks"""
+        first_col = max(0, view.left // self.chunk_width - margin)
+        last_col = min(self.cols - 1, (view.right - 1) // self.chunk_width + margin)
+        first_row = max(0, view.top // self.chunk_height - margin)
+        last_row = min(self.rows - 1, (view.bottom - 1) // self.chunk_height + margin)
+        return [(col, row) for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def update(self, view):
+        """Ativar e desativar chunks para a área visível `view` (Rect no mundo)"""
+        keys = self.keys_around(view, self.margin)
+        wanted = set(keys)
+        for key in sorted(self.active - wanted, key=lambda key: (key[1], key[0])):
+            self.active.discard(key)
+            self.deactivate(key)
+        for key in keys:
+            if key not in self.active:
+                self.active.add(key)
+                self.activate(key)
@@ -0,0 +1,73 @@
+import math
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class ChunkedTileLayer:
+    """Camada estática de tiles pré-renderizada em pedaços do tamanho da tela
+
+    Os blocos nunca mudam, então cada pedaço (chunk) é desenhado uma única
+    vez, quando seus blocos são carregados com set_chunk; remove_chunk
+    libera a superfície quando o chunk sai da área ativa. No quadro só os
+    chunks visíveis são desenhados (no máximo quatro, normalmente um ou
+    dois), seja qual for o tamanho do level.
+    """
+
+    def __init__(self, level_size, chunk_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.level_width, self.level_height = level_size
+        self.chunk_width, self.chunk_height = chunk_size
+        self.cols = max(1, -(-self.level_width // self.chunk_width))
+        self.rows = max(1, -(-self.level_height // self.chunk_height))
+
+        # Só chunks carregados com blocos têm superfície
+        self.chunks = {}
+
+    def set_chunk(self, key, blocks):
+        """Desenhar os blocos de um chunk (chunks sem blocos não guardam nada)"""
+        surface = self.build_chunk(key[0], key[1], blocks)
+        if surface is not None:
+            self.chunks[key] = surface
+        else:
+            self.chunks.pop(key, None)
+
+    def remove_chunk(self, key):
+        self.chunks.pop(key, None)
+
+    def chunks_overlapping(self, rect):
+        first_col = max(0, rect.left // self.chunk_width)
+        last_col = min(self.cols - 1, (rect.right - 1) // self.chunk_width)
+        first_row = max(0, rect.top // self.chunk_height)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // self.chunk_height)
+        return [(col, row) for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def build_chunk(self, col, row, blocks):
+        """Desenhar os blocos de um chunk numa superfície própria"""
+        if not blocks:
+            return None
+
+        origin_x = col * self.chunk_width
+        origin_y = row * self.chunk_height
+        surface = pygame.Surface((self.chunk_width, self.chunk_height), pygame.SRCALPHA)
+        for block in blocks:
+            surface.blit(block.image, (block.rect.x - origin_x, block.rect.y - origin_y))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        # RLE: as áreas transparentes (a maior parte do chunk) saem quase de graça no blit
+        surface.set_alpha(255, pygame.RLEACCEL)
+        return surface
+
+    def draw(self, screen, camera):
+        """Desenhar os chunks que aparecem na tela"""
+        # Arredondar como int(x - camera) faz para os sprites na tela
+        camera_x = math.ceil(camera.offset[0])
+        camera_y = math.ceil(camera.offset[1])
+        view = pygame.Rect(camera_x, camera_y, screen.get_width(), screen.get_height())
+        drawn = 0
+        for key in self.chunks_overlapping(view):
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                screen.blit(chunk, (key[0] * self.chunk_width - camera_x,
+                                    key[1] * self.chunk_height - camera_y))
+                drawn += 1
+        camera.record("chunks", drawn, len(self.chunks) - drawn)
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+import numpy
+from utils.assets_loader import get_resource_path
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Cache binário: cabeçalho, metadados em JSON, bytes dos tiles, spawns e colisores em int32
+CACHE_MAGIC = b"DHLV"
+CACHE_VERSION = 2
+# magic, versão, colunas, linhas, tile, largura e altura do chunk, spawns, colisores, metadados
+CACHE_HEADER = struct.Struct("<4sHHHHHHIII")
+
+# Chunks do streaming (e dos colisores mesclados): do tamanho da tela
+CHUNK_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+class LevelData:
+    """Dados de um level carregados de um arquivo JSON
+
+    tiles é um array (linhas, colunas) de uint8: 0 é vazio e o tipo i
+    (a partir de 1) usa a imagem tile_images[i - 1]. Largura e altura do
+    level em pixels vêm daqui; nenhum outro lugar deve repeti-las.
+
+    colliders guarda os tiles sólidos de cada chunk mesclados em
+    retângulos máximos, como linhas (coluna do chunk, linha do chunk,
+    coluna, linha, largura, altura), em tiles.
+    """
+
+    def __init__(self, name, tile_size, tiles, tile_images, player_spawn, enemy_spawns, background,
+                 chunk_size=CHUNK_SIZE, colliders=None):
+        self.name = name
+        self.tile_size = tile_size
+        self.tiles = tiles
+        self.tile_images = tile_images
+        self.player_spawn = player_spawn
+        self.enemy_spawns = enemy_spawns  # array (n, 2) de int32
+        self.background = background
+        self.chunk_size = chunk_size
+        self.rows, self.cols = tiles.shape
+        self.width = self.cols * tile_size
+        self.height = self.rows * tile_size
+        self.chunk_cols = max(1, -(-self.width // chunk_size[0]))
+        self.chunk_rows = max(1, -(-self.height // chunk_size[1]))
+        self.colliders = merge_level_colliders(self) if colliders is None else colliders
+
+        # Colisores separados por chunk para o streaming
+        self.chunk_colliders = {}
+        for row in self.colliders.tolist():
+            self.chunk_colliders.setdefault((row[0], row[1]), []).append(row[2:])
+
+    def chunk_tiles(self, key):
+        """Faixa de tiles (primeira coluna, última + 1, primeira linha, última + 1) de um chunk"""
+        size = self.tile_size
+        chunk_width, chunk_height = self.chunk_size
+        first_col = -(-key[0] * chunk_width // size)
+        last_col = min(self.cols, -(-(key[0] + 1) * chunk_width // size))
+        first_row = -(-key[1] * chunk_height // size)
+        last_row = min(self.rows, -(-(key[1] + 1) * chunk_height // size))
+        return first_col, last_col, first_row, last_row
+
+def merge_solid_tiles(solid):
+    """Cobrir os tiles sólidos com retângulos máximos (greedy meshing)
+
+    Varre linha a linha: cada tile sólido ainda livre abre um retângulo
+    que cresce para a direita e depois para baixo enquanto a faixa
+    inteira for sólida e livre. Retorna (coluna, linha, largura, altura).
+    """
+    free = solid.copy()
+    rows, cols = free.shape
+    rects = []
+    for row in range(rows):
+        col = 0
+        while col < cols:
+            if not free[row, col]:
+                col += 1
+                continue
+            width = 1
+            while col + width < cols and free[row, col + width]:
+                width += 1
+            height = 1
+            while row + height < rows and free[row + height, col:col + width].all():
+                height += 1
+            free[row:row + height, col:col + width] = False
+            rects.append((col, row, width, height))
+            col += width
+    return rects
+
+def merge_level_colliders(level_data):
+    """Colisores mesclados de cada chunk (um retângulo nunca cruza a borda de um chunk)"""
+    solid = level_data.tiles != 0
+    colliders = []
+    for chunk_row in range(level_data.chunk_rows):
+        for chunk_col in range(level_data.chunk_cols):
+            first_col, last_col, first_row, last_row = level_data.chunk_tiles((chunk_col, chunk_row))
+            for col, row, width, height in merge_solid_tiles(solid[first_row:last_row, first_col:last_col]):
+                colliders.append((chunk_col, chunk_row, first_col + col, first_row + row, width, height))
+    return numpy.array(colliders, dtype=numpy.int32).reshape(-1, 6)
+
+# Registro global: nome do level -> LevelData
+_level_registry = {}
+
+def get_level_data(level_name):
+    """Obter os dados do level, lendo arquivo (ou cache) só na primeira vez"""
+    level_data = _level_registry.get(level_name)
+    if level_data is None:
+        level_data = _level_registry[level_name] = load_level_data(level_name)
+    return level_data
+
+def get_cache_dir():
+    """Pasta persistente e gravável para o cache dos levels
+
+    No executável do PyInstaller os recursos ficam em sys._MEIPASS, uma
+    pasta temporária apagada ao sair; o cache vai para a pasta de cache
+    do usuário. Em desenvolvimento fica em .cache/levels na raiz do projeto.
+    """
+    if getattr(sys, 'frozen', False):
+        base = (os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') or
+                os.path.join(os.path.expanduser('~'), '.cache'))
+        return os.path.join(base, 'DemonHunter', 'levels')
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, '.cache', 'levels')
+
+def load_level_data(level_name, cache_dir=None):
+    """Carregar src/levels/data/<level_name>.json pelo cache binário quando possível"""
+    level_path = get_resource_path(os.path.join("src", "levels", "data", level_name + ".json"))
+    return load_level_file(level_path, cache_dir)
+
+def load_level_file(level_path, cache_dir=None):
+    """Carregar um arquivo de level, compilando e gravando o cache se preciso
+
+    O cache é indexado pelo hash do arquivo: qualquer edição no JSON gera
+    uma nova compilação na próxima carga.
+    """
+    level_name = os.path.splitext(os.path.basename(level_path))[0]
+    with open(level_path, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha1(source).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir or get_cache_dir(), f"{level_name}.{digest}.bin")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return read_cache(f.read())
+    except (OSError, ValueError, struct.error):
+        pass
+
+    level_data = compile_level(json.loads(source))
+    write_cache(level_data, cache_path, level_name)
+    return level_data
+
+def compile_level(config):
+    """Converter o JSON do level (linhas de texto + legenda) em LevelData
+
+    Inclui a etapa de mesclagem dos tiles sólidos em colisores, feita uma
+    vez só e guardada no cache.
+    """
+    rows = config["tiles"]
+    cols = len(rows[0]) if rows else 0
+    for row_index, row in enumerate(rows):
+        if len(row) != cols:
+            raise ValueError(f"Linha {row_index} do level tem {len(row)} tiles (esperado {cols})")
+
+    # Tabela caractere -> tipo de tile (0 = vazio); tipos na ordem da legenda
+    tile_images = []
+    lookup = numpy.zeros(256, dtype=numpy.uint8)
+    known = numpy.zeros(256, dtype=bool)
+    for char, image in config["legend"].items():
+        known[ord(char)] = True
+        if image is not None:
+            tile_images.append(image)
+            lookup[ord(char)] = len(tile_images)
+
+    chars = numpy.frombuffer("".join(rows).encode('ascii'), dtype=numpy.uint8).reshape(len(rows), cols)
+    if not known[chars].all():
+        row_index, col_index = numpy.argwhere(~known[chars])[0]
+        raise ValueError(f"Tile desconhecido {chr(chars[row_index, col_index])!r} "
+                         f"na linha {row_index}, coluna {col_index}")
+
+    spawns = numpy.array(config.get("enemy_spawns", []), dtype=numpy.int32).reshape(-1, 2)
+    return LevelData(config.get("name", ""), config.get("tile_size", 64), lookup[chars],
+                     tile_images, tuple(config["player_spawn"]), spawns, config.get("background", {}))
+
+def read_cache(data):
+    (magic, version, cols, rows, tile_size, chunk_width, chunk_height,
+     spawn_count, collider_count, meta_size) = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError("Cache de level inválido")
+    if (chunk_width, chunk_height) != CHUNK_SIZE:
+        raise ValueError("Cache de level compilado para outro tamanho de chunk")
+
+    offset = CACHE_HEADER.size
+    meta = json.loads(data[offset:offset + meta_size])
+    offset += meta_size
+    tiles = numpy.frombuffer(data, dtype=numpy.uint8, count=rows * cols, offset=offset).reshape(rows, cols).copy()
+    offset += rows * cols
+    spawns = numpy.frombuffer(data, dtype='<i4', count=spawn_count * 2, offset=offset)
+    offset += spawn_count * 8
+    colliders = numpy.frombuffer(data, dtype='<i4', count=collider_count * 6, offset=offset)
+    return LevelData(meta["name"], tile_size, tiles, meta["tile_images"], tuple(meta["player_spawn"]),
+                     spawns.astype(numpy.int32).reshape(-1, 2), meta["background"],
+                     CHUNK_SIZE, colliders.astype(numpy.int32).reshape(-1, 6))
+
+def write_cache(level_data, cache_path, level_name):
+    """Gravar o level compilado; falhas de escrita só custam recompilar"""
+    meta = json.dumps({
+        "name": level_data.name,
+        "tile_images": level_data.tile_images,
+        "player_spawn": level_data.player_spawn,
+        "background": level_data.background
+    }).encode('utf-8')
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, level_data.cols, level_data.rows,
+                               level_data.tile_size, level_data.chunk_size[0], level_data.chunk_size[1],
+                               len(level_data.enemy_spawns), len(level_data.colliders), len(meta))
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Versões antigas do mesmo level não servem mais
+        for file_name in os.listdir(cache_dir):
+            if file_name.startswith(level_name + ".") and file_name.endswith(".bin"):
+                os.remove(os.path.join(cache_dir, file_name))
+        with open(cache_path, 'wb') as f:
+            f.write(header)
+            f.write(meta)
+            f.write(level_data.tiles.tobytes())
+            f.write(level_data.enemy_spawns.astype('<i4').tobytes())
+            f.write(level_data.colliders.astype('<i4').tobytes())
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o cache do level {level_name}: {e}")
+
+def clear_level_registry():
+    _level_registry.clear()
@@ -1,55 +1,63 @@
 import pygame
 import math
 import random
-from entities.Block import Block
+import numpy
+from entities.Block import Block, get_tile_image
 from entities.Demon import Demon
+from levels.LevelData import get_level_data
+from levels.TileGrid import TileGrid
+from levels.ChunkedTileLayer import ChunkedTileLayer
+from levels.ChunkStreamer import ChunkStreamer
+from levels.BakedParallaxLayer import BakedParallaxLayer
 from utils.assets_loader import load_image
+from utils.broadphase import TrackedGroup
+from utils.gradients import get_vertical_gradient
+from utils.post_processing import draw_tint
+from utils.particles import ParticleSystem, Emitter, ParticleRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class Level_1:
-    def __init__(self, game):
+    def __init__(self, game, level_name="level_1", data=None):
         self.game = game
-        self.blocks = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = TrackedGroup()  # Versão de membros para a broadphase
 
         # Background elements
         self.background_elements = []
         self.parallax_layers = []
-        self.atmospheric_particles = []
+        self.atmospheric_particles = ParticleSystem()
+        # Alpha segue a vida da partícula, com máximo de 60%
+        self.ash_renderer = ParticleRenderer(self.build_ash_sprite, max_alpha=int(255 * 0.6))
         self.animation_timer = 0
 
-        self.map_data = [
-            "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@",
-            "@.............................@",
-            "@.............................@",
-            "@.............................@",
-            "@.........##..................@",
-            "@.............................@",
-            "@.............................@",
-            "@....##.......#...............@",
-            "@....@@.......@...............@",
-            "@.....................#.......@",
-            "@.......##.##.........@.......@",
-            "@#######@@#@@#########@#######@"
-        ]
+        # Tiles, spawns, dimensões e parâmetros do background vêm do arquivo do level
+        # (ou de um LevelData já pronto)
+        self.data = data if data is not None else get_level_data(level_name)
+        self.width = self.data.width
+        self.height = self.data.height
+        self.enemy_spawns = [tuple(spawn) for spawn in self.data.enemy_spawns.tolist()]
 
-        # Definir posições dos inimigos
-        self.enemy_spawns = [
-            (400, 600),   # Posição 1
-            (800, 600),   # Posição 2  
-            (1000, 400),  # Posição 3
-            (1500, 650)   # Posição 4 - ajustada para o chão
-        ]
+        # Streaming: blocos e inimigos só existem nos chunks perto da câmera.
+        # Os blocos vão um chunk além dos inimigos, para que um inimigo
+        # ativo sempre tenha chão e paredes carregados ao redor
+        self.streamer = ChunkStreamer((self.width, self.height), self.activate_chunk, self.deactivate_chunk,
+                                      self.data.chunk_size, margin=2)
+        self.enemy_margin = 1
+        self.chunk_colliders = {}    # chave do chunk -> colisores mesclados registrados no TileGrid
+        self.dormant_enemies = {}    # chave do chunk -> registros de inimigos adormecidos
+        self.dormant_count = 0
+        self.free_demons = []        # Demons fora do jogo, prontos para reaproveitar
+        self.next_spawn_order = 0
 
         self.create_background()
         self.create_level()
         self.spawn_enemies()
         self.create_atmospheric_effects()
+        # Nenhum chunk ativo ainda: o primeiro stream() vem da cena, em volta da câmera
 
     def create_background(self):
         """Criar elementos de background em camadas"""
-        level_width = 31 * 64  # Largura total do level
-        level_height = 12 * 64  # Altura total do level
+        level_width = self.width
+        level_height = self.height
         
         # Camada 1: Céu gradiente
         self.sky_gradient = self.create_sky_gradient()
@@ -65,25 +73,20 @@ class Level_1:
         
         # Camada 5: Elementos decorativos no chão
         self.create_ground_decorations(level_width, level_height)
+        
+        # Camadas estáticas são pré-desenhadas; a neblina continua dinâmica
+        self.bake_static_layers()
 
     def create_sky_gradient(self):
         """Criar gradiente do céu"""
-        sky_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
         # Gradiente do céu (vermelho sombrio para preto)
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(60 * (1 - ratio) + 20 * ratio)
-            g = int(20 * (1 - ratio) + 10 * ratio)
-            b = int(30 * (1 - ratio) + 25 * ratio)
-            pygame.draw.line(sky_surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        
-        return sky_surface
+        colors = [tuple(color) for color in self.data.background.get("sky_colors", [(60, 20, 30), (20, 10, 25)])]
+        return get_vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), colors)
 
     def create_mountain_layer(self, level_width, level_height):
         """Criar camada de montanhas distantes"""
         mountains = []
-        num_mountains = 8
+        num_mountains = self.data.background.get("mountains", 8)
         
         for i in range(num_mountains):
             x = (level_width / num_mountains) * i + random.randint(-100, 100)
@@ -109,7 +112,10 @@ class Level_1:
     def create_dead_trees(self, level_width, level_height):
         """Criar árvores mortas"""
         trees = []
-        num_trees = 15
+        num_trees = self.data.background.get("trees", 15)
+        
+        # Gerador próprio para os galhos: forma fixa sem mexer no random global
+        branch_random = random.Random(level_width)
         
         for i in range(num_trees):
             x = random.randint(0, level_width)
@@ -117,13 +123,16 @@ class Level_1:
             
             tree = {
                 'x': x,
-                'y': level_height - tree_height - 64,  # Acima do chão
+                'y': level_height - tree_height - self.data.tile_size,  # Acima do chão
                 'height': tree_height,
                 'width': random.randint(8, 15),
                 'branches': random.randint(2, 4),
                 'color': (60, 40, 30),
                 'parallax_speed': 0.5
             }
+            # Comprimento e desvio vertical de cada galho, sorteados uma vez
+            tree['branch_shapes'] = [(branch_random.randint(20, 40), branch_random.randint(-15, 15))
+                                     for _ in range(tree['branches'])]
             trees.append(tree)
         
         self.parallax_layers.append({
@@ -135,7 +144,7 @@ class Level_1:
     def create_fog_layers(self, level_width, level_height):
         """Criar camadas de neblina"""
         fog_patches = []
-        num_patches = 12
+        num_patches = self.data.background.get("fog_patches", 12)
         
         for i in range(num_patches):
             patch = {
@@ -147,6 +156,8 @@ class Level_1:
                 'drift_speed': random.uniform(0.1, 0.3),
                 'parallax_speed': 0.8
             }
+            # A forma da neblina nunca muda: desenhar o sprite uma vez só
+            patch['sprite'], patch['sprite_offset'] = self.build_fog_sprite(patch)
             fog_patches.append(patch)
         
         self.parallax_layers.append({
@@ -158,9 +169,10 @@ class Level_1:
     def create_ground_decorations(self, level_width, level_height):
         """Criar decorações no chão"""
         decorations = []
+        background = self.data.background
         
         # Pedras
-        for _ in range(25):
+        for _ in range(background.get("rocks", 25)):
             decoration = {
                 'x': random.randint(0, level_width),
                 'y': level_height - random.randint(10, 30),
@@ -172,7 +184,7 @@ class Level_1:
             decorations.append(decoration)
         
         # Ossadas
-        for _ in range(8):
+        for _ in range(background.get("bones", 8)):
             decoration = {
                 'x': random.randint(0, level_width),
                 'y': level_height - random.randint(5, 15),
@@ -185,7 +197,7 @@ class Level_1:
             decorations.append(decoration)
         
         # Crateras pequenas
-        for _ in range(10):
+        for _ in range(background.get("craters", 10)):
             decoration = {
                 'x': random.randint(0, level_width),
                 'y': level_height - 5,
@@ -203,44 +215,154 @@ class Level_1:
             'parallax_speed': 1.0
         })
 
+    def bake_static_layers(self):
+        """Trocar o desenho por elemento das camadas estáticas por segmentos prontos"""
+        draw_functions = {
+            'mountain': self.draw_mountain,
+            'tree': self.draw_dead_tree,
+            'decoration': self.draw_ground_decoration
+        }
+        for layer in self.parallax_layers:
+            draw_element = draw_functions.get(layer['type'])
+            if draw_element is not None:
+                layer['baked'] = BakedParallaxLayer(layer['elements'], layer['parallax_speed'],
+                                                    draw_element, self.get_element_bounds)
+
+    def get_element_bounds(self, element):
+        """Retângulo (no mundo) que um elemento de background ocupa ao ser desenhado"""
+        x = int(element['x'])
+        y = int(element['y'])
+        kind = element.get('type')
+        if 'branches' in element:
+            # Tronco mais o alcance dos galhos (até 40 px para os lados, 15 para cima/baixo)
+            return pygame.Rect(x - 42, y - 17, element['width'] + 84, element['height'] + 34)
+        if kind == 'rock':
+            return pygame.Rect(x - element['size'], y - element['size'], element['size'] * 2 + 3, element['size'] * 2 + 3)
+        if kind == 'bone':
+            radius = element['height'] // 2
+            return pygame.Rect(x - radius, y, element['width'] + radius * 2 + 1, element['height'] + 1)
+        if kind == 'crater':
+            return pygame.Rect(x - element['radius'], y - element['radius'], element['radius'] * 2 + 1, element['radius'] * 2 + 1)
+        # Montanha: triângulo principal mais os picos (30 px para cada lado)
+        return pygame.Rect(x - 30, y, element['width'] + 61, element['height'] + 1)
+
     def create_atmospheric_effects(self):
         """Criar partículas atmosféricas"""
-        for _ in range(20):
-            particle = {
-                'x': random.randint(0, 31 * 64),
-                'y': random.randint(0, 12 * 64),
-                'speed_x': random.uniform(-0.2, 0.2),
-                'speed_y': random.uniform(-0.5, 0.1),
-                'size': random.randint(1, 3),
-                'color': random.choice([
-                    (100, 80, 70),   # Cinza acastanhado
-                    (80, 70, 60),    # Marrom claro
-                    (60, 50, 40),    # Marrom escuro
-                ]),
-                'life': random.randint(300, 800),
-                'max_life': 800,
-                'type': 'ash'
-            }
-            self.atmospheric_particles.append(particle)
+        level_width = self.width
+        level_height = self.height
+        ash_colors = [
+            (100, 80, 70),   # Cinza acastanhado
+            (80, 70, 60),    # Marrom claro
+            (60, 50, 40),    # Marrom escuro
+        ]
+        Emitter(self.atmospheric_particles, x=(0, level_width), y=(0, level_height),
+                vx=(-0.2, 0.2), vy=(-0.5, 0.1), size=(1, 3), life=(300, 800), max_life=800,
+                colors=ash_colors).emit(self.data.background.get("ash_particles", 20))
+        
+        # Reposição: com menos de 15 cinzas, chance de 1 em 30 por passo
+        self.ash_emitter = Emitter(self.atmospheric_particles, x=(-50, level_width + 50), y=(-20, level_height),
+                                   vx=(-0.3, 0.3), vy=(-0.8, 0.2), size=(1, 4), life=(400, 1000), max_life=1000,
+                                   colors=ash_colors, chance=1 / 30, max_alive=15)
 
     def create_level(self):
-        grass = load_image("grass_block.png")
-        rocky = load_image("rocky_block.png")
-
-        for row_index, row in enumerate(self.map_data):
-            for col_index, tile in enumerate(row):
-                if tile == "#":
-                    block = Block(grass, col_index * 64, row_index * 64)
-                    self.blocks.add(block)
-                if tile == "@":
-                    block = Block(rocky, col_index * 64, row_index * 64)
-                    self.blocks.add(block)
+        data = self.data
+        # Uma imagem por tipo de tile, já no tamanho do bloco, compartilhada por todos os blocos
+        self.tile_images = [get_tile_image(load_image(name), data.tile_size) for name in data.tile_images]
+        
+        # Índice de colisão: uma célula por tile do mapa (máscara sólida do level inteiro)
+        self.tile_grid = TileGrid(data.cols, data.rows, data.tile_size, data.tiles != 0)
+        
+        # Tiles estáticos pré-renderizados em chunks do tamanho da tela
+        self.tile_layer = ChunkedTileLayer((self.width, self.height), data.chunk_size)
     
     def spawn_enemies(self):
-        """Cria os inimigos do level"""
+        """Registrar os inimigos do level como dormentes no chunk do spawn"""
         for x, y in self.enemy_spawns:
+            self.add_dormant_enemy(self.streamer.chunk_at(x, y), (self.next_spawn_order, x, y, None, None, None))
+            self.next_spawn_order += 1
+    
+    def add_dormant_enemy(self, key, record):
+        self.dormant_enemies.setdefault(key, []).append(record)
+        self.dormant_count += 1
+    
+    def activate_chunk(self, key):
+        """Desenhar os tiles e registrar os colisores mesclados de um chunk que entrou na área ativa"""
+        data = self.data
+        size = data.tile_size
+        first_col, last_col, first_row, last_row = data.chunk_tiles(key)
+        
+        tiles = data.tiles[first_row:last_row, first_col:last_col]
+        rows, cols = numpy.nonzero(tiles)
+        # Os blocos só servem para desenhar a superfície do chunk e são descartados em seguida
+        blocks = [Block(self.tile_images[tile - 1], (first_col + col) * size, (first_row + row) * size, size)
+                  for row, col, tile in zip(rows.tolist(), cols.tolist(), tiles[rows, cols].tolist())]
+        self.tile_layer.set_chunk(key, blocks)
+        
+        # Colisão contra os retângulos mesclados na compilação do level, não contra cada tile
+        self.chunk_colliders[key] = [self.tile_grid.add_rect(*collider)
+                                     for collider in data.chunk_colliders.get(key, [])]
+    
+    def deactivate_chunk(self, key):
+        """Liberar colisores e superfície de um chunk que saiu da área ativa"""
+        for collider in self.chunk_colliders.pop(key, []):
+            self.tile_grid.remove(collider)
+        self.tile_layer.remove_chunk(key)
+    
+    def stream(self, view):
+        """Ativar o que está perto da área visível (Rect no mundo) e adormecer o resto"""
+        self.streamer.update(view)
+        awake = set(self.streamer.keys_around(view, self.enemy_margin))
+        
+        # Inimigos que saíram da área ativa viram registros dormentes
+        for enemy in list(self.enemies):
+            key = self.streamer.chunk_at(*enemy.rect.center)
+            if key not in awake:
+                self.sleep_enemy(enemy, key)
+        
+        # Registros dos chunks ativos voltam ao jogo na ordem original dos spawns
+        records = []
+        for key in awake & self.dormant_enemies.keys():
+            records.extend(self.dormant_enemies.pop(key))
+        for record in sorted(records):
+            self.wake_enemy(record)
+        
+        # Segmentos do background longe da câmera são descartados (recriados ao voltar)
+        for layer in self.parallax_layers:
+            baked = layer.get('baked')
+            if baked is not None:
+                visible = baked.visible_segments(view.x, view.width)
+                baked.evict(range(visible.start - 1, visible.stop + 1))
+    
+    def sleep_enemy(self, enemy, key):
+        order = getattr(enemy, 'spawn_order', None)
+        if order is None:
+            order = self.next_spawn_order
+            self.next_spawn_order += 1
+        self.add_dormant_enemy(key, (order, enemy.rect.centerx, enemy.rect.centery,
+                                     enemy.health, enemy.start_x, enemy.direction))
+        enemy.kill()
+        self.free_demons.append(enemy)
+    
+    def wake_enemy(self, record):
+        order, x, y, health, start_x, direction = record
+        self.dormant_count -= 1
+        if self.free_demons:
+            demon = self.free_demons.pop()
+            demon.reset(x, y)
+        else:
             demon = Demon(x, y)
-            self.enemies.add(demon)
+        demon.spawn_order = order
+        if health is not None:
+            # Estado guardado ao adormecer (registros de spawn começam do zero)
+            demon.health = health
+            demon.start_x = start_x
+            demon.direction = direction
+            demon.facing_right = direction > 0
+        self.enemies.add(demon)
+    
+    def remaining_enemies(self):
+        """Inimigos vivos no level, ativos ou dormentes"""
+        return len(self.enemies) + self.dormant_count
     
     def get_enemies(self):
         """Retorna o grupo de inimigos do level"""
@@ -259,41 +381,18 @@ class Level_1:
                 for fog in layer['elements']:
                     fog['x'] += fog['drift_speed']
                     # Reposicionar quando sair da tela
-                    if fog['x'] > 31 * 64 + 300:
+                    if fog['x'] > self.width + 300:
                         fog['x'] = -300
 
     def update_atmospheric_particles(self):
         """Atualizar partículas atmosféricas"""
-        for particle in self.atmospheric_particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['life'] -= 1
-            
-            # Remover partículas mortas
-            if particle['life'] <= 0:
-                self.atmospheric_particles.remove(particle)
-        
-        # Adicionar novas partículas ocasionalmente
-        if len(self.atmospheric_particles) < 15 and random.randint(1, 30) == 1:
-            new_particle = {
-                'x': random.randint(-50, 31 * 64 + 50),
-                'y': random.randint(-20, 12 * 64),
-                'speed_x': random.uniform(-0.3, 0.3),
-                'speed_y': random.uniform(-0.8, 0.2),
-                'size': random.randint(1, 4),
-                'color': random.choice([
-                    (100, 80, 70),
-                    (80, 70, 60),
-                    (60, 50, 40),
-                ]),
-                'life': random.randint(400, 1000),
-                'max_life': 1000,
-                'type': 'ash'
-            }
-            self.atmospheric_particles.append(new_particle)
+        self.atmospheric_particles.update()
+        self.ash_emitter.update()
 
-    def draw_background(self, screen, camera_x, camera_y):
+    def draw_background(self, screen, camera):
         """Desenhar todas as camadas do background com parallax"""
+        camera_x, camera_y = camera.offset
+        
         # Céu gradiente (fixo)
         screen.blit(self.sky_gradient, (0, 0))
         
@@ -302,13 +401,18 @@ class Level_1:
             self.draw_parallax_layer(screen, layer, camera_x, camera_y)
         
         # Desenhar partículas atmosféricas
-        self.draw_atmospheric_particles(screen, camera_x, camera_y)
+        self.draw_atmospheric_particles(screen, camera)
         
         # Efeitos de iluminação
         self.draw_lighting_effects(screen, camera_x, camera_y)
 
     def draw_parallax_layer(self, screen, layer, camera_x, camera_y):
         """Desenhar uma camada específica com efeito parallax"""
+        baked = layer.get('baked')
+        if baked is not None:
+            baked.draw(screen, camera_x, camera_y)
+            return
+        
         parallax_x = camera_x * layer['parallax_speed']
         parallax_y = camera_y * layer['parallax_speed']
         
@@ -357,12 +461,11 @@ class Level_1:
         
         # Galhos
         branch_y = y + tree['height'] // 3
-        for i in range(tree['branches']):
-            branch_length = random.randint(20, 40)
+        for i, (branch_length, branch_drop) in enumerate(tree['branch_shapes']):
             branch_angle = (-1 + i * 0.5) if i % 2 == 0 else (1 - i * 0.3)
             
             end_x = x + tree['width'] // 2 + branch_length * branch_angle
-            end_y = branch_y + random.randint(-15, 15)
+            end_y = branch_y + branch_drop
             
             pygame.draw.line(screen, tree['color'], 
                            (x + tree['width'] // 2, branch_y), 
@@ -370,22 +473,30 @@ class Level_1:
             
             branch_y += tree['height'] // (tree['branches'] + 1)
 
-    def draw_fog_patch(self, screen, fog, x, y):
-        """Desenhar patch de neblina"""
-        # Criar superfície com alpha
-        fog_surface = pygame.Surface((fog['width'], fog['height']), pygame.SRCALPHA)
+    def build_fog_sprite(self, fog):
+        """Sprite do patch de neblina, recortado ao redor do círculo
         
+        Retorna a superfície e o deslocamento dela em relação ao canto do patch.
+        """
         # Gradiente circular para neblina
         center_x = fog['width'] // 2
         center_y = fog['height'] // 2
         max_radius = min(center_x, center_y)
         
+        fog_surface = pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA)
         for radius in range(max_radius, 0, -5):
             alpha = int(fog['alpha'] * (radius / max_radius))
             color = (150, 150, 150, alpha)
-            pygame.draw.circle(fog_surface, color, (center_x, center_y), radius)
+            pygame.draw.circle(fog_surface, color, (max_radius, max_radius), radius)
         
-        screen.blit(fog_surface, (int(x), int(y)))
+        if pygame.display.get_surface() is not None:
+            fog_surface = fog_surface.convert_alpha()
+        return fog_surface, (center_x - max_radius, center_y - max_radius)
+
+    def draw_fog_patch(self, screen, fog, x, y):
+        """Desenhar patch de neblina"""
+        offset_x, offset_y = fog['sprite_offset']
+        screen.blit(fog['sprite'], (int(x) + offset_x, int(y) + offset_y))
 
     def draw_ground_decoration(self, screen, decoration, x, y):
         """Desenhar decorações do chão"""
@@ -410,24 +521,19 @@ class Level_1:
             pygame.draw.circle(screen, (decoration['color'][0] + 20, decoration['color'][1] + 10, decoration['color'][2] + 10), 
                              (int(x), int(y)), decoration['radius'], 2)
 
-    def draw_atmospheric_particles(self, screen, camera_x, camera_y):
+    def draw_atmospheric_particles(self, screen, camera):
         """Desenhar partículas atmosféricas"""
-        for particle in self.atmospheric_particles:
-            screen_x = particle['x'] - camera_x
-            screen_y = particle['y'] - camera_y
-            
-            # Só desenhar se visível
-            if -10 <= screen_x <= SCREEN_WIDTH + 10 and -10 <= screen_y <= SCREEN_HEIGHT + 10:
-                # Alpha baseado na vida da partícula
-                alpha_ratio = particle['life'] / particle['max_life']
-                alpha = int(255 * alpha_ratio * 0.6)  # Máximo 60% de alpha
-                
-                # Criar superfície com alpha
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle['color'], alpha)
-                pygame.draw.circle(particle_surface, particle['color'], (particle['size'], particle['size']), particle['size'])
-                
-                screen.blit(particle_surface, (int(screen_x - particle['size']), int(screen_y - particle['size'])))
+        # Culling no espaço do mundo, antes de calcular qualquer posição na tela
+        particles = self.atmospheric_particles
+        n = particles.count
+        visible = camera.cull_boxes(particles.x[:n], particles.y[:n], 0, 0, "particles", 10)
+        self.ash_renderer.draw(screen, particles, camera.offset, visible)
+
+    def build_ash_sprite(self, size, color, kind, alpha):
+        """Sprite de uma partícula de cinza"""
+        particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(particle_surface, color, (size, size), size)
+        return particle_surface
 
     def draw_lighting_effects(self, screen, camera_x, camera_y):
         """Desenhar efeitos de iluminação atmosférica"""
@@ -435,7 +541,5 @@ class Level_1:
         light_intensity = 30 + 10 * abs(math.sin(self.animation_timer * 0.02))
         light_color = (int(light_intensity), int(light_intensity * 0.3), int(light_intensity * 0.2))
         
-        # Overlay de luz
-        light_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        light_surface.fill((*light_color, 20))
-        screen.blit(light_surface, (0, 0))
\ No newline at end of file
+        # Overlay de luz (buffer persistente, sem alocar por quadro)
+        draw_tint(screen, light_color, 20)
\ No newline at end of file
@@ -0,0 +1,125 @@
+import numpy
+import pygame
+
+class Collider:
+    """Retângulo sólido alinhado aos tiles (vários tiles mesclados)"""
+
+    __slots__ = ('rect',)
+
+    def __init__(self, rect):
+        self.rect = rect
+
+class TileGrid:
+    """Índice de colisão em grade uniforme para os blocos do level
+    
+    Cada célula guarda o colisor sólido que a ocupa (ou None): um bloco
+    ou um Collider que cobre vários tiles, registrado em todas as células
+    que ocupa. Uma consulta olha só as células cobertas pelo retângulo,
+    então o custo depende do tamanho da entidade e não do tamanho do level.
+    
+    Com chunk streaming só os chunks ativos têm blocos nas células; a
+    máscara `solid` (passada pelo level) cobre o level inteiro, então
+    collides e collides_many valem em qualquer lugar.
+    """
+    
+    def __init__(self, cols, rows, tile_size=64, solid=None):
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.cells = [None] * (cols * rows)
+        # Máscara para testes em lote
+        self.solid = numpy.zeros((rows, cols), dtype=bool) if solid is None else solid.astype(bool)
+    
+    def cell_range(self, rect):
+        """Células (primeira coluna, última, primeira linha, última) cobertas pelo retângulo"""
+        size = self.tile_size
+        return (max(0, rect.left // size), min(self.cols - 1, (rect.right - 1) // size),
+                max(0, rect.top // size), min(self.rows - 1, (rect.bottom - 1) // size))
+    
+    def add(self, block):
+        """Registrar um bloco ou colisor em todas as células que ele cobre"""
+        first_col, last_col, first_row, last_row = self.cell_range(block.rect)
+        for row in range(first_row, last_row + 1):
+            offset = row * self.cols
+            for col in range(first_col, last_col + 1):
+                self.cells[offset + col] = block
+        if first_col <= last_col and first_row <= last_row:
+            self.solid[first_row:last_row + 1, first_col:last_col + 1] = True
+    
+    def add_rect(self, col, row, width, height):
+        """Criar e registrar um Collider de width x height tiles"""
+        size = self.tile_size
+        collider = Collider(pygame.Rect(col * size, row * size, width * size, height * size))
+        self.add(collider)
+        return collider
+    
+    def remove(self, block):
+        """Tirar o bloco das células (a máscara sólida continua marcada)"""
+        first_col, last_col, first_row, last_row = self.cell_range(block.rect)
+        for row in range(first_row, last_row + 1):
+            offset = row * self.cols
+            for col in range(first_col, last_col + 1):
+                if self.cells[offset + col] is block:
+                    self.cells[offset + col] = None
+    
+    def get(self, col, row):
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[row * self.cols + col]
+        return None
+    
+    def query(self, rect):
+        """Colisores que se sobrepõem ao retângulo, sem repetição (ordem linha a linha)"""
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        
+        size = self.tile_size
+        first_col = max(0, rect.left // size)
+        last_col = min(self.cols - 1, (rect.right - 1) // size)
+        first_row = max(0, rect.top // size)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // size)
+        
+        hits = []
+        for row in range(first_row, last_row + 1):
+            offset = row * self.cols
+            for col in range(first_col, last_col + 1):
+                block = self.cells[offset + col]
+                if block is not None and block not in hits:
+                    hits.append(block)
+        return hits
+    
+    def collides(self, rect):
+        """Se o retângulo toca algum bloco sólido"""
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        
+        size = self.tile_size
+        first_col = max(0, rect.left // size)
+        last_col = min(self.cols - 1, (rect.right - 1) // size)
+        first_row = max(0, rect.top // size)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // size)
+        
+        if first_col > last_col or first_row > last_row:
+            return False
+        return bool(self.solid[first_row:last_row + 1, first_col:last_col + 1].any())
+
+    def collides_many(self, xs, ys, width, height):
+        """Versão vetorizada de collides para vários retângulos do mesmo tamanho
+        
+        Testa só os quatro cantos, então vale para retângulos que não são
+        maiores que um tile (como as balas).
+        """
+        size = self.tile_size
+        first_cols = numpy.floor_divide(xs, size).astype(numpy.int64)
+        last_cols = numpy.floor_divide(xs + (width - 1), size).astype(numpy.int64)
+        first_rows = numpy.floor_divide(ys, size).astype(numpy.int64)
+        last_rows = numpy.floor_divide(ys + (height - 1), size).astype(numpy.int64)
+        
+        hits = numpy.zeros(len(xs), dtype=bool)
+        for cols in (first_cols, last_cols):
+            col_valid = (cols >= 0) & (cols < self.cols)
+            safe_cols = numpy.clip(cols, 0, self.cols - 1)
+            for rows in (first_rows, last_rows):
+                valid = col_valid & (rows >= 0) & (rows < self.rows)
+                safe_rows = numpy.clip(rows, 0, self.rows - 1)
+                hits |= valid & self.solid[safe_rows, safe_cols]
+        return hits
@@ -1,3 +1,8 @@
 from . import Level_1
+from . import TileGrid
+from . import ChunkedTileLayer
+from . import ChunkStreamer
+from . import BakedParallaxLayer
+from . import LevelData
 
-__all__ = ["Level_1"]
\ No newline at end of file
+__all__ = ["Level_1", "TileGrid", "ChunkedTileLayer", "ChunkStreamer", "BakedParallaxLayer", "LevelData"]
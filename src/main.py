@@ -1,10 +1,45 @@
+import argparse
 import pygame
-from game import Game 
+from game import Game, enable_headless
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Demon Hunter")
+    parser.add_argument("--headless", action="store_true",
+                        help="Rodar sem janela (driver dummy do SDL), sem flip e sem limite de FPS")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="Número de passos da simulação no modo headless")
+    parser.add_argument("--draw", choices=["offscreen", "screen", "none"], default="offscreen",
+                        help="Onde desenhar no modo headless ('none' pula o draw)")
+    parser.add_argument("--scene", choices=["menu", "game", "victory"], default="game",
+                        help="Cena inicial no modo headless")
+    return parser.parse_args()
+
+def create_scene(name, game):
+    if name == "game":
+        from scenes.GameScene import GameScene
+        return GameScene(game)
+    if name == "victory":
+        from scenes.VictoryScene import VictoryScene
+        return VictoryScene(game)
+    from scenes.MenuScene import MenuScene
+    return MenuScene(game)
 
 def main(): 
+    args = parse_args()
+    
+    if args.headless:
+        enable_headless()
+    
     pygame.init()
     game = Game()
-    game.run()
+    
+    if args.headless:
+        game.scene_manager.set_scene(create_scene(args.scene, game))
+        stats = game.run_headless(args.frames, draw_mode=args.draw)
+        print(f"{stats['frames']} passos de {stats['scene']} em {stats['seconds']:.2f}s "
+              f"({stats['ticks_per_second']:.1f} ticks/s, draw={stats['draw_mode']})")
+    else:
+        game.run()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -2,54 +2,116 @@ import pygame
 import math
 from scenes.Scene import Scene
 from entities.Player import Player
+from entities.BulletManager import BulletManager
 from levels.Level_1 import Level_1
 from utils.assets_loader import load_image
 from hud.HUD import HUD
+from hud.ProfilerOverlay import ProfilerOverlay
+from utils.profiler import profiler
+from utils.gradients import get_vertical_gradient
+from utils.post_processing import draw_vignette, draw_tint
+from utils.fonts import get_font, render_text
+from utils.broadphase import SweepAndPrune
+from utils.camera import Camera
+from utils.lighting import LightMap
+from utils.particles import ParticleSystem, Emitter, ParticleRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
+# Tipos de partícula da tela de game over
+PARTICLE_BLOOD = 0
+PARTICLE_ASH = 1
+PARTICLE_EMBER = 2
+
 class GameScene(Scene):
-    def __init__(self, game):
+    def __init__(self, game, level_data=None):
         super().__init__(game)
         
-        # Inicializar componentes do jogo
-        image_player = load_image("Player.png")
-        self.player = Player(image_player, 150, 650)
-        self.all_sprites = pygame.sprite.Group()
-        
         # Criar o level
-        self.level = Level_1(game)
-        self.all_sprites.add(self.level.blocks)
+        self.level = Level_1(game, data=level_data)
         
-        # Grupo para as balas
-        self.bullets = pygame.sprite.Group()
+        # Inicializar componentes do jogo
+        image_player = load_image("Player.png")
+        self.player = Player(image_player, *self.level.data.player_spawn)
         
         # Obter inimigos do level
         self.enemies = self.level.get_enemies()
         
+        # Broadphase para as colisões entre personagens
+        self.enemy_broadphase = SweepAndPrune()
+        
+        # Fonte de entrada do teclado (substituível por entrada roteirizada)
+        self.read_input = pygame.key.get_pressed
+        
         # HUD
         self.hud = HUD()
-        self.hud.set_total_enemies(len(self.enemies))  # Definir total para barra de progresso
+        self.hud.set_total_enemies(self.level.remaining_enemies())  # Definir total para barra de progresso
+        
+        # Sistema de câmera (suavização, interpolação e culling)
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, smooth=0.1)
+        
+        # Mapa de luz (brilho dos demons e do disparo)
+        self.light_map = LightMap((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.demon_light_color = (150, 30, 10)
+        self.muzzle_light_color = (255, 210, 120)
         
-        # Sistema de câmera
-        self.camera_x = 0
-        self.camera_y = 0
-        self.camera_smooth = 0.1
+        # Dimensões do level (definidas pelo arquivo do level)
+        self.level_width = self.level.width
+        self.level_height = self.level.height
         
-        # Dimensões do level (31 colunas x 12 linhas, cada tile 64x64)
-        self.level_width = 31 * 64  # 1984 pixels
-        self.level_height = 12 * 64  # 768 pixels
+        # Balas em arrays (movimento e colisões em lote)
+        self.bullets = BulletManager((self.level_width, self.level_height))
+        
+        # Câmera já centrada no spawn e chunks ativos em volta antes do primeiro passo
+        self.camera.snap(self.player.rect, self.level_width, self.level_height)
+        self.stream_level()
         
         # Variáveis para Game Over
         self.game_over = False
         self.killer_demon = None
         self.killer_taunt = ""  # Texto fixo do demon que matou
         self.game_over_timer = 0  # Timer para animações da tela de game over
-        self.game_over_particles = []  # Partículas da tela de game over
+        self.game_over_glow = None  # Brilho do título de game over (alpha muda por quadro)
+        self.game_over_particles = ParticleSystem()  # Partículas da tela de game over
+        self.game_over_particle_renderer = ParticleRenderer(self.build_game_over_particle_sprite)
+        self.game_over_emitter = None
+        
+        # Fases do passo de simulação e do desenho (nomes usados pelo profiler)
+        self.update_phases = [
+            ("player.update", self.update_player),
+            ("enemies.update", self.update_enemies),
+            ("check_character_collisions", self.check_character_collisions),
+            ("check_demon_attacks", self.check_demon_attacks),
+            ("check_collisions", self.check_collisions),
+            ("update_camera", self.update_camera),
+            ("level.stream", self.stream_level),
+            ("bullets.update", self.bullets.update),
+            ("check_bullet_collisions", self.check_bullet_collisions),
+            ("check_enemy_collisions", self.check_enemy_collisions),
+            ("check_game_over", self.check_game_over),
+            ("hud.update", self.update_hud),
+            ("level.update", self.level.update),
+        ]
+        self.draw_phases = [
+            ("draw.background", self.draw_level_background),
+            ("draw.blocks", self.draw_blocks),
+            ("draw.player", self.draw_player),
+            ("draw.enemies", self.draw_enemies),
+            ("draw.bullets", self.draw_bullets),
+            ("draw.lighting", self.draw_lighting),
+            ("draw.hud", self.draw_hud),
+            ("draw.game_over", self.draw_game_over_layer),
+        ]
+        
+        # Overlay de depuração do profiler (F3)
+        self.profiler_overlay = ProfilerOverlay()
         
     def handle_events(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r and self.game_over:
+                if event.key == pygame.K_F3:
+                    # Ligar/desligar profiler e overlay
+                    profiler.toggle()
+                elif event.key == pygame.K_r and self.game_over:
                     # Reiniciar jogo
                     self.next_scene = GameScene(self.game)
                 elif event.key == pygame.K_ESCAPE:
@@ -57,46 +119,56 @@ class GameScene(Scene):
                     from scenes.MenuScene import MenuScene
                     self.next_scene = MenuScene(self.game)
     
+    def save_previous_state(self):
+        """Guardar posições do passo anterior para interpolar o desenho"""
+        self.camera.save_previous_state()
+        self.player.prev_pos = self.player.rect.topleft
+        for enemy in self.enemies:
+            enemy.prev_pos = enemy.rect.topleft
+        self.bullets.save_previous_state()
+    
+    def interpolate_position(self, sprite, camera_x, camera_y):
+        """Posição na tela interpolada entre os dois últimos passos da simulação"""
+        x, y = sprite.rect.topleft
+        prev_pos = getattr(sprite, 'prev_pos', None)
+        if prev_pos is not None:
+            x = prev_pos[0] + (x - prev_pos[0]) * self.interpolation
+            y = prev_pos[1] + (y - prev_pos[1]) * self.interpolation
+        return (int(x - camera_x), int(y - camera_y))
+    
     def update(self):
         if self.game_over:
+            self.update_game_over()
             return
-            
-        keys_pressed = pygame.key.get_pressed()
         
-        # Atualizar player e capturar bala se disparada
-        bullet = self.player.update(keys_pressed)
-        if bullet:
-            self.bullets.add(bullet)
+        if profiler.enabled:
+            for name, phase in self.update_phases:
+                profiler.run(name, phase)
+        else:
+            for name, phase in self.update_phases:
+                phase()
+    
+    def update_player(self):
+        keys_pressed = self.read_input()
+        
+        # Atualizar player e criar a bala se houve disparo
+        shot = self.player.update(keys_pressed)
+        if shot:
+            self.bullets.spawn(*shot)
         
         # Aplicar gravidade
         self.player.apply_gravity()
-        
-        # Atualizar inimigos
+    
+    def update_enemies(self):
+        player_pos = (self.player.rect.centerx, self.player.rect.centery)
         for enemy in self.enemies:
-            enemy.update(player_pos=(self.player.rect.centerx, self.player.rect.centery))
-        
-        # Verificar colisões entre personagens
-        self.check_character_collisions()
-        
-        # Verificar ataques de demons
-        self.check_demon_attacks()
-        
-        # Verificar colisões entre player e blocos
-        self.check_collisions()
-        
-        # Atualizar câmera
-        self.update_camera()
-        
-        # Atualizar balas
-        self.bullets.update()
-        
-        # Verificar colisões entre balas e blocos
-        self.check_bullet_collisions()
-        
-        # Verificar colisões com inimigos
-        self.check_enemy_collisions()
-        
-        # Verificar Game Over
+            enemy.update(player_pos=player_pos)
+    
+    def update_hud(self):
+        self.hud.update(self.player)
+    
+    def check_game_over(self):
+        """Verificar Game Over e Vitória"""
         if self.player.health <= 0 and not self.game_over:
             self.game_over = True
             self.game_over_timer = 0  # Resetar timer
@@ -130,71 +202,103 @@ class GameScene(Scene):
                 self.killer_taunt = random.choice(taunts)
         
         # Verificar Vitória - todos os demônios foram derrotados
-        if len(self.enemies) == 0 and not self.game_over:
+        if self.level.remaining_enemies() == 0 and not self.game_over:
             from scenes.VictoryScene import VictoryScene
             self.next_scene = VictoryScene(self.game)
+    
+    def update_game_over(self):
+        """Avançar animações da tela de game over no passo da simulação"""
+        self.game_over_timer += 1
+        self.update_game_over_particles()
         
-        self.all_sprites.update()
-        
-        # Atualizar background do level
-        self.level.update()
+        # Forçar animação idle do demon assassino e continuar atualizando
+        if self.killer_demon:
+            self.killer_demon.set_animation("idle")
+            self.killer_demon.speed_x = 0
+            self.killer_demon.update_animation()
     
     def draw(self, screen):
+        # Câmera interpolada entre os dois últimos passos
+        camera_x, camera_y = self.camera.begin_frame(self.interpolation)
+        
+        if profiler.enabled:
+            for name, phase in self.draw_phases:
+                profiler.run(name, phase, screen, camera_x, camera_y)
+            self.profiler_overlay.draw(screen, profiler, self.game.clock.get_fps(), self.camera.get_stats())
+        else:
+            for name, phase in self.draw_phases:
+                phase(screen, camera_x, camera_y)
+    
+    def draw_level_background(self, screen, camera_x, camera_y):
         # Desenhar background do level com parallax
-        self.level.draw_background(screen, self.camera_x, self.camera_y)
-        
-        # Desenhar todos os sprites com offset da câmera
-        for sprite in self.all_sprites:
-            screen_rect = sprite.rect.copy()
-            screen_rect.x -= self.camera_x
-            screen_rect.y -= self.camera_y
-            screen.blit(sprite.image, screen_rect)
-        
+        self.level.draw_background(screen, self.camera)
+    
+    def draw_blocks(self, screen, camera_x, camera_y):
+        # Desenhar os chunks visíveis da camada de tiles
+        self.level.tile_layer.draw(screen, self.camera)
+    
+    def draw_player(self, screen, camera_x, camera_y):
         # Desenhar o player com offset da câmera
         if not self.game_over:
-            player_screen_rect = self.player.rect.copy()
-            player_screen_rect.x -= self.camera_x
-            player_screen_rect.y -= self.camera_y
+            player_screen_pos = self.interpolate_position(self.player, camera_x, camera_y)
             
             # Efeito de invencibilidade (piscar)
             if self.player.invincible_timer > 0 and self.player.invincible_timer % 10 < 5:
                 pass  # Não desenhar o player (efeito piscar)
             else:
-                screen.blit(self.player.image, player_screen_rect)
+                screen.blit(self.player.image, player_screen_pos)
             
             # Desenhar efeito muzzle flash
-            self.player.draw_muzzle_flash(screen, self.camera_x, self.camera_y)
-        
-        # Desenhar inimigos com offset da câmera
-        for enemy in self.enemies:
-            enemy_screen_rect = enemy.rect.copy()
-            enemy_screen_rect.x -= self.camera_x
-            enemy_screen_rect.y -= self.camera_y
-            screen.blit(enemy.image, enemy_screen_rect)
-        
+            self.player.draw_muzzle_flash(screen, player_screen_pos)
+    
+    def draw_enemies(self, screen, camera_x, camera_y):
+        # Desenhar só os inimigos visíveis (candidatos em x vêm da broadphase).
+        # Depois das colisões os rects andaram e o grupo pode ter mudado
+        # (mortes, streaming): sincronizar e reordenar antes da busca
+        self.enemy_broadphase.update(self.enemies)
+        candidates = self.enemy_broadphase.query(self.camera.visible_rect(64))
+        for enemy in self.camera.cull(self.enemies, "enemies", 64, candidates):
+            screen.blit(enemy.image, self.interpolate_position(enemy, camera_x, camera_y))
+    
+    def draw_bullets(self, screen, camera_x, camera_y):
         # Desenhar as balas com offset da câmera
-        for bullet in self.bullets:
-            bullet_screen_rect = bullet.rect.copy()
-            bullet_screen_rect.x -= self.camera_x
-            bullet_screen_rect.y -= self.camera_y
-            screen.blit(bullet.image, bullet_screen_rect)
-        
+        self.bullets.draw(screen, self.camera, self.interpolation)
+    
+    def draw_lighting(self, screen, camera_x, camera_y):
+        # Luzes em grade grossa somadas sobre o cenário e os personagens
+        if self.game_over:
+            return
+        self.light_map.clear()
+        
+        # Brilho pulsante dos demons próximos da tela
+        pulse = 0.55 + 0.15 * math.sin(self.level.animation_timer * 0.1)
+        for enemy in self.camera.cull(self.enemies, "lights", 96):
+            x, y = self.interpolate_position(enemy, camera_x, camera_y)
+            self.light_map.add_light(x + enemy.rect.width // 2, y + enemy.rect.height // 2,
+                                     96, self.demon_light_color, pulse)
+        
+        # Clarão do disparo, apagando junto com o muzzle flash
+        if self.player.muzzle_flash_timer > 0:
+            x, y = self.interpolate_position(self.player, camera_x, camera_y)
+            flash_offset = -8 if self.player.facing_left else self.player.rect.width + 8
+            intensity = self.player.muzzle_flash_timer / self.player.muzzle_flash_duration
+            self.light_map.add_light(x + flash_offset, y + self.player.rect.height // 2,
+                                     128, self.muzzle_light_color, intensity)
+        
+        self.light_map.draw(screen)
+    
+    def draw_hud(self, screen, camera_x, camera_y):
         # Desenhar HUD
         if not self.game_over:
-            self.hud.draw(screen, self.player, len(self.enemies))
-        
+            self.hud.draw(screen, self.player, self.level.remaining_enemies())
+    
+    def draw_game_over_layer(self, screen, camera_x, camera_y):
         # Desenhar tela de Game Over
         if self.game_over:
-            self.game_over_timer += 1
             self.draw_game_over(screen)
     
     def draw_game_over(self, screen):
         """Tela de Game Over melhorada com efeitos visuais avançados"""
-        import random
-        
-        # Atualizar partículas
-        self.update_game_over_particles()
-        
         # Fundo gradiente dramático
         self.draw_dramatic_background(screen)
         
@@ -222,93 +326,58 @@ class GameScene(Scene):
     
     def create_game_over_particles(self):
         """Criar partículas para a tela de game over"""
-        import random
-        self.game_over_particles = []
-        for _ in range(40):
-            particle = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'speed_x': random.uniform(-1, 1),
-                'speed_y': random.uniform(-2, 0.5),
-                'size': random.randint(2, 8),
-                'color': random.choice([
+        self.game_over_particles.clear()
+        
+        # Leva inicial: sangue (com gravidade leve), cinzas e brasas
+        Emitter(self.game_over_particles, x=(0, SCREEN_WIDTH), y=(0, SCREEN_HEIGHT),
+                vx=(-1.0, 1.0), vy=(-2.0, 0.5), size=(2, 8), life=(200, 500), max_life=500,
+                colors=[
                     (150, 0, 0),      # Vermelho escuro
                     (100, 0, 0),      # Vermelho muito escuro
                     (80, 20, 20),     # Marrom avermelhado
                     (60, 60, 60),     # Cinza escuro
-                ]),
-                'life': random.randint(200, 500),
-                'max_life': 500,
-                'type': random.choice(['blood', 'ash', 'ember'])
-            }
-            self.game_over_particles.append(particle)
+                ],
+                kinds=(PARTICLE_BLOOD, PARTICLE_ASH, PARTICLE_EMBER),
+                gravity=(0.02, 0.0, 0.0)).emit(40)
+        
+        # Gotas de sangue caindo do topo de vez em quando
+        self.game_over_emitter = Emitter(self.game_over_particles, x=(0, SCREEN_WIDTH), y=-10,
+                                         vx=(-0.5, 0.5), vy=(0.5, 2.0), size=(2, 6), life=(200, 400),
+                                         max_life=400, colors=[(150, 0, 0), (100, 0, 0), (80, 20, 20)],
+                                         kinds=(PARTICLE_BLOOD,), gravity=0.02,
+                                         chance=0.1, max_alive=30)
     
     def update_game_over_particles(self):
         """Atualizar partículas da tela de game over"""
-        import random
-        
-        for particle in self.game_over_particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['life'] -= 1
-            
-            # Gravidade leve para algumas partículas
-            if particle['type'] == 'blood':
-                particle['speed_y'] += 0.02
-            
-            # Remover partículas mortas
-            if particle['life'] <= 0:
-                self.game_over_particles.remove(particle)
-        
-        # Adicionar novas partículas ocasionalmente
-        if len(self.game_over_particles) < 30 and random.randint(1, 10) == 1:
-            new_particle = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': -10,
-                'speed_x': random.uniform(-0.5, 0.5),
-                'speed_y': random.uniform(0.5, 2),
-                'size': random.randint(2, 6),
-                'color': random.choice([
-                    (150, 0, 0),
-                    (100, 0, 0),
-                    (80, 20, 20),
-                ]),
-                'life': random.randint(200, 400),
-                'max_life': 400,
-                'type': 'blood'
-            }
-            self.game_over_particles.append(new_particle)
+        self.game_over_particles.update()
+        if self.game_over_emitter is not None:
+            self.game_over_emitter.update()
     
     def draw_dramatic_background(self, screen):
         """Desenhar fundo gradiente dramático"""
         # Gradiente vermelho escuro para preto
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(40 * (1 - ratio))
-            g = int(10 * (1 - ratio))
-            b = int(10 * (1 - ratio))
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        screen.blit(get_vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), [(40, 10, 10), (0, 0, 0)]), (0, 0))
         
         # Overlay pulsante
         pulse = 0.3 + 0.1 * abs(math.sin(self.game_over_timer * 0.03))
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((50, 0, 0, int(50 * pulse)))
-        screen.blit(overlay, (0, 0))
+        draw_tint(screen, (50, 0, 0), int(50 * pulse))
     
     def draw_game_over_particles(self, screen):
         """Desenhar partículas da tela de game over"""
-        for particle in self.game_over_particles:
-            alpha_ratio = particle['life'] / particle['max_life']
-            alpha = int(255 * alpha_ratio)
-            
-            if particle['type'] == 'ember':
-                # Partículas brilhantes
-                glow_size = particle['size'] + 2
-                glow_color = (particle['color'][0] + 50, particle['color'][1] + 20, 0)
-                pygame.draw.circle(screen, glow_color, (int(particle['x']), int(particle['y'])), glow_size)
-            
-            # Partícula principal
-            pygame.draw.circle(screen, particle['color'], (int(particle['x']), int(particle['y'])), particle['size'])
+        self.game_over_particle_renderer.draw(screen, self.game_over_particles)
+    
+    def build_game_over_particle_sprite(self, size, color, kind, alpha):
+        """Sprite de uma partícula do game over (brasas ganham um halo)"""
+        radius = size + 2
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        if kind == PARTICLE_EMBER:
+            # Partículas brilhantes
+            glow_color = (min(255, color[0] + 50), min(255, color[1] + 20), 0)
+            pygame.draw.circle(sprite, glow_color, (radius, radius), radius)
+        
+        # Partícula principal
+        pygame.draw.circle(sprite, color, (radius, radius), size)
+        return sprite
     
     def draw_screen_cracks(self, screen):
         """Desenhar efeito de rachadura na tela"""
@@ -341,12 +410,11 @@ class GameScene(Scene):
         shake_y = int(2 * math.sin(self.game_over_timer * 0.3))
         
         # Sombra múltipla para profundidade
-        font_title = pygame.font.Font(None, 120)
         title_text = "GAME OVER"
         
         for offset in [(4, 4), (2, 2), (1, 1)]:
             shadow_color = (20 - offset[0] * 5, 0, 0)
-            shadow_surface = font_title.render(title_text, True, shadow_color)
+            shadow_surface = render_text(title_text, 120, shadow_color)
             shadow_rect = shadow_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset[0] + shake_x, 120 + offset[1] + shake_y))
             screen.blit(shadow_surface, shadow_rect)
         
@@ -354,23 +422,19 @@ class GameScene(Scene):
         main_color = (255, 50, 50)
         glow_intensity = 50 + 30 * abs(math.sin(self.game_over_timer * 0.1))
         
-        title_surface = font_title.render(title_text, True, main_color)
+        title_surface = render_text(title_text, 120, main_color)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2 + shake_x, 120 + shake_y))
         screen.blit(title_surface, title_rect)
         
-        # Efeito de brilho
-        glow_surface = pygame.Surface(title_surface.get_size(), pygame.SRCALPHA)
-        glow_text = font_title.render(title_text, True, (255, 100, 100, int(glow_intensity)))
-        glow_surface.blit(glow_text, (0, 0))
-        screen.blit(glow_surface, title_rect)
+        # Efeito de brilho: cópia própria do texto (a do cache é compartilhada),
+        # criada uma vez; só o alpha pulsa a cada quadro
+        if self.game_over_glow is None:
+            self.game_over_glow = render_text(title_text, 120, (255, 100, 100)).copy()
+        self.game_over_glow.set_alpha(int(glow_intensity))
+        screen.blit(self.game_over_glow, title_rect)
     
     def draw_killer_demon_panel(self, screen):
         """Desenhar painel do demon assassino"""
-        # Forçar animação idle e continuar atualizando
-        self.killer_demon.set_animation("idle")
-        self.killer_demon.speed_x = 0
-        self.killer_demon.update_animation()
-        
         # Painel para o demon
         panel_width = 500
         panel_height = 200
@@ -378,9 +442,7 @@ class GameScene(Scene):
         panel_y = 200
         
         # Fundo do painel
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill((20, 10, 10, 200))
-        screen.blit(panel_surface, (panel_x, panel_y))
+        draw_tint(screen, (20, 10, 10), 200, (panel_x, panel_y, panel_width, panel_height))
         
         # Borda do painel
         pygame.draw.rect(screen, (150, 50, 50), (panel_x, panel_y, panel_width, panel_height), 4)
@@ -393,10 +455,9 @@ class GameScene(Scene):
         
         # Aura vermelha ao redor do demon
         aura_intensity = 100 + 50 * abs(math.sin(self.game_over_timer * 0.1))
-        aura_surface = pygame.Surface((140, 140), pygame.SRCALPHA)
-        aura_surface.fill((255, 0, 0, int(aura_intensity * 0.3)))
-        aura_rect = aura_surface.get_rect(center=demon_rect.center)
-        screen.blit(aura_surface, aura_rect)
+        aura_rect = pygame.Rect(0, 0, 140, 140)
+        aura_rect.center = demon_rect.center
+        draw_tint(screen, (255, 0, 0), int(aura_intensity * 0.3), aura_rect)
         
         # Balão de fala melhorado
         bubble_width = 280
@@ -405,9 +466,7 @@ class GameScene(Scene):
         bubble_y = panel_y + 50
         
         # Fundo do balão
-        bubble_surface = pygame.Surface((bubble_width, bubble_height), pygame.SRCALPHA)
-        bubble_surface.fill((40, 20, 20, 220))
-        screen.blit(bubble_surface, (bubble_x, bubble_y))
+        draw_tint(screen, (40, 20, 20), 220, (bubble_x, bubble_y, bubble_width, bubble_height))
         
         # Borda do balão
         pygame.draw.rect(screen, (255, 150, 150), (bubble_x, bubble_y, bubble_width, bubble_height), 3)
@@ -422,7 +481,7 @@ class GameScene(Scene):
         pygame.draw.polygon(screen, (255, 150, 150), bubble_tip, 3)
         
         # Texto do demon (quebrado em linhas se necessário)
-        font_taunt = pygame.font.Font(None, 32)
+        font_taunt = get_font(32)
         words = self.killer_taunt.split()
         lines = []
         current_line = ""
@@ -440,31 +499,29 @@ class GameScene(Scene):
         
         # Desenhar linhas do texto
         for i, line in enumerate(lines):
-            text_surface = font_taunt.render(line, True, (255, 255, 255))
+            text_surface = render_text(line, 32, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(bubble_x + bubble_width // 2, bubble_y + 30 + i * 35))
             screen.blit(text_surface, text_rect)
     
     def draw_death_stats(self, screen):
         """Desenhar estatísticas da morte"""
         stats_y = 420
-        font_stats = pygame.font.Font(None, 36)
         
         # Título das estatísticas
-        stats_title = font_stats.render("ESTATÍSTICAS DA MISSÃO", True, (200, 100, 100))
+        stats_title = render_text("ESTATÍSTICAS DA MISSÃO", 36, (200, 100, 100))
         title_rect = stats_title.get_rect(center=(SCREEN_WIDTH // 2, stats_y))
         screen.blit(stats_title, title_rect)
         
         # Estatísticas (simuladas por agora)
-        enemies_defeated = self.hud.total_enemies - len(self.enemies) if hasattr(self.hud, 'total_enemies') else 0
+        enemies_defeated = self.hud.total_enemies - self.level.remaining_enemies() if hasattr(self.hud, 'total_enemies') else 0
         stats = [
             f"Demônios derrotados: {enemies_defeated}",
             f"Vida restante: 0/{self.player.health + abs(self.player.health)}",
             "Causa da morte: Ataque demônico"
         ]
         
-        font_small = pygame.font.Font(None, 28)
         for i, stat in enumerate(stats):
-            stat_surface = font_small.render(stat, True, (180, 180, 180))
+            stat_surface = render_text(stat, 28, (180, 180, 180))
             stat_rect = stat_surface.get_rect(center=(SCREEN_WIDTH // 2, stats_y + 40 + i * 30))
             screen.blit(stat_surface, stat_rect)
     
@@ -485,11 +542,10 @@ class GameScene(Scene):
         self.draw_action_button(screen, menu_button, "VOLTAR AO MENU", (50, 50, 100), (70, 70, 150))
         
         # Instruções
-        font_instructions = pygame.font.Font(None, 24)
         instructions = ["R - Reiniciar    ESC - Menu Principal"]
         
         for instruction in instructions:
-            text = font_instructions.render(instruction, True, (150, 150, 150))
+            text = render_text(instruction, 24, (150, 150, 150))
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
             screen.blit(text, text_rect)
     
@@ -509,46 +565,33 @@ class GameScene(Scene):
         pygame.draw.rect(screen, hover_color, pulsed_rect, 3)
         
         # Texto do botão
-        font_button = pygame.font.Font(None, 32)
-        text_surface = font_button.render(text, True, (255, 255, 255))
+        text_surface = render_text(text, 32, (255, 255, 255))
         text_rect = text_surface.get_rect(center=pulsed_rect.center)
         screen.blit(text_surface, text_rect)
     
     def draw_vignette_effect(self, screen):
         """Desenhar efeito de vinheta escura nas bordas"""
-        vignette_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Criar gradiente radial das bordas para o centro
-        center_x = SCREEN_WIDTH // 2
-        center_y = SCREEN_HEIGHT // 2
-        max_distance = math.sqrt(center_x**2 + center_y**2)
-        
-        for y in range(0, SCREEN_HEIGHT, 5):
-            for x in range(0, SCREEN_WIDTH, 5):
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                alpha = min(150, int(150 * (distance / max_distance) ** 2))
-                
-                pygame.draw.rect(vignette_surface, (0, 0, 0, alpha), (x, y, 5, 5))
-        
-        screen.blit(vignette_surface, (0, 0))
+        # Máscara pré-calculada por resolução; aqui só é aplicada
+        draw_vignette(screen)
     
     # Métodos de colisão (copiados do game.py original)
     def update_camera(self):
-        target_camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-        target_camera_y = self.player.rect.centery - SCREEN_HEIGHT // 2
-        
-        target_camera_x = max(0, min(target_camera_x, self.level_width - SCREEN_WIDTH))
-        target_camera_y = max(0, min(target_camera_y, self.level_height - SCREEN_HEIGHT))
-        
-        self.camera_x += (target_camera_x - self.camera_x) * self.camera_smooth
-        self.camera_y += (target_camera_y - self.camera_y) * self.camera_smooth
+        self.camera.follow(self.player.rect, self.level_width, self.level_height)
+
+    def stream_level(self):
+        # Chunks ativos seguem a posição da câmera na simulação e também o
+        # player (com folga), que pode estar à frente da câmera suavizada
+        view = pygame.Rect(int(self.camera.x), int(self.camera.y), self.camera.width, self.camera.height)
+        margin = self.level.data.tile_size * 2
+        view.union_ip(self.player.rect.inflate(margin * 2, margin * 2))
+        self.level.stream(view)
 
     def check_collisions(self):
         # Reset on_ground no início de cada frame
         self.player.on_ground = False
         
         # Colisão horizontal
-        collisions = pygame.sprite.spritecollide(self.player, self.level.blocks, False)
+        collisions = self.level.tile_grid.query(self.player.rect)
         for block in collisions:
             if self.player.rect.centerx < block.rect.centerx:
                 self.player.rect.right = block.rect.left
@@ -559,7 +602,7 @@ class GameScene(Scene):
         self.player.rect.y += self.player.speed_y
         
         # Colisão vertical
-        collisions = pygame.sprite.spritecollide(self.player, self.level.blocks, False)
+        collisions = self.level.tile_grid.query(self.player.rect)
         for block in collisions:
             if self.player.speed_y > 0:  # Caindo
                 self.player.rect.bottom = block.rect.top
@@ -570,31 +613,24 @@ class GameScene(Scene):
                 self.player.speed_y = 0
         
         # Verificar limites da tela (chão de emergência)
-        if self.player.rect.bottom > SCREEN_HEIGHT:
-            self.player.rect.bottom = SCREEN_HEIGHT
+        if self.player.rect.bottom > self.level_height:
+            self.player.rect.bottom = self.level_height
             self.player.speed_y = 0
             self.player.on_ground = True
 
     def check_bullet_collisions(self):
-        for bullet in self.bullets:
-            collisions = pygame.sprite.spritecollide(bullet, self.level.blocks, False)
-            if collisions:
-                bullet.kill()
+        self.bullets.check_blocks(self.level.tile_grid)
 
     def check_enemy_collisions(self):
         # Verificar colisão entre balas e inimigos
-        for bullet in self.bullets:
-            hit_enemies = pygame.sprite.spritecollide(bullet, self.enemies, False)
-            for enemy in hit_enemies:
-                bullet.kill()
-                enemy.take_damage(1)
+        self.bullets.check_enemies(self.enemies)
         
         # Verificar colisão entre inimigos e blocos
         for enemy in self.enemies:
             enemy.on_ground = False
             
             # Colisão horizontal
-            collisions = pygame.sprite.spritecollide(enemy, self.level.blocks, False)
+            collisions = self.level.tile_grid.query(enemy.rect)
             for block in collisions:
                 if enemy.rect.centerx < block.rect.centerx:
                     enemy.rect.right = block.rect.left
@@ -609,7 +645,7 @@ class GameScene(Scene):
             enemy.rect.y += enemy.speed_y
             
             # Colisão vertical
-            collisions = pygame.sprite.spritecollide(enemy, self.level.blocks, False)
+            collisions = self.level.tile_grid.query(enemy.rect)
             for block in collisions:
                 if enemy.speed_y > 0:  # Caindo
                     enemy.rect.bottom = block.rect.top
@@ -620,8 +656,12 @@ class GameScene(Scene):
                     enemy.speed_y = 0
 
     def check_character_collisions(self):
-        # Colisão entre player e demons
-        for enemy in self.enemies:
+        # Colisão entre player e demons (só os que cruzam o player no eixo x)
+        # Os candidatos vêm do rect do player antes dos empurrões: se um
+        # empurrão o jogar sobre um demon fora da lista, essa sobreposição
+        # só é resolvida no próximo passo
+        self.enemy_broadphase.update(self.enemies)
+        for enemy in self.enemy_broadphase.query(self.player.rect):
             if self.player.rect.colliderect(enemy.rect):
                 player_center_x = self.player.rect.centerx
                 enemy_center_x = enemy.rect.centerx
@@ -633,22 +673,24 @@ class GameScene(Scene):
                     self.player.rect.left = enemy.rect.right + 1
                     enemy.push_away(-1)
         
-        # Colisão entre demons
-        enemies_list = list(self.enemies)
-        for i, enemy1 in enumerate(enemies_list):
-            for enemy2 in enemies_list[i+1:]:
-                if enemy1.rect.colliderect(enemy2.rect):
-                    enemy1_center_x = enemy1.rect.centerx
-                    enemy2_center_x = enemy2.rect.centerx
-                    
-                    if enemy1_center_x < enemy2_center_x:
-                        enemy1.rect.right = enemy2.rect.left - 1
-                        enemy1.push_away(-1)
-                        enemy2.push_away(1)
-                    else:
-                        enemy1.rect.left = enemy2.rect.right + 1
-                        enemy1.push_away(1)
-                        enemy2.push_away(-1)
+        # Colisão entre demons (só pares candidatos do sweep and prune)
+        # Os empurrões do player mexeram nos rects: reordenar antes de gerar os
+        # pares. Sobreposições criadas pelos empurrões entre demons ficam para
+        # o próximo passo
+        self.enemy_broadphase.sort()
+        for enemy1, enemy2 in self.enemy_broadphase.pairs():
+            if enemy1.rect.colliderect(enemy2.rect):
+                enemy1_center_x = enemy1.rect.centerx
+                enemy2_center_x = enemy2.rect.centerx
+                
+                if enemy1_center_x < enemy2_center_x:
+                    enemy1.rect.right = enemy2.rect.left - 1
+                    enemy1.push_away(-1)
+                    enemy2.push_away(1)
+                else:
+                    enemy1.rect.left = enemy2.rect.right + 1
+                    enemy1.push_away(1)
+                    enemy2.push_away(-1)
 
     def check_demon_attacks(self):
         for enemy in self.enemies:
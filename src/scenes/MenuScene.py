@@ -1,7 +1,9 @@
 import pygame
 import math
-import random
 from scenes.Scene import Scene
+from utils.gradients import get_vertical_gradient
+from utils.fonts import render_text
+from utils.particles import ParticleSystem, Emitter, ParticleRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class MenuScene(Scene):
@@ -11,11 +13,11 @@ class MenuScene(Scene):
         # Timer para animações
         self.animation_timer = 0
         
-        # Fontes
-        self.title_font = pygame.font.Font(None, 96)
-        self.button_font = pygame.font.Font(None, 42)
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.instruction_font = pygame.font.Font(None, 28)
+        # Tamanhos de fonte (fontes vêm do registro compartilhado)
+        self.title_font_size = 96
+        self.button_font_size = 42
+        self.subtitle_font_size = 36
+        self.instruction_font_size = 28
         
         # Cores temáticas (tons sombrios e vermelhos)
         self.bg_color = (15, 15, 25)
@@ -26,8 +28,10 @@ class MenuScene(Scene):
         self.button_border_color = (200, 50, 50)
         self.button_text_color = (255, 255, 255)
         
+        # Fundo gradiente (azul escuro no topo para vermelho escuro embaixo)
+        self.background = get_vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), [(15, 15, 25), (40, 15, 15)])
+        
         # Partículas de fundo (efeito de fogo/embers)
-        self.particles = []
         self.create_particles()
         
         # Botões com posições e estados
@@ -45,27 +49,31 @@ class MenuScene(Scene):
         
         # Efeitos visuais
         self.title_glow_intensity = 0
+        self.title_glow = None  # Brilho do título (alpha muda por quadro)
+        self.control_overlay = None  # Fundo semi-transparente dos itens de controle
         self.ember_timer = 0
         
     def create_particles(self):
         """Criar partículas de ember/fogo para o fundo"""
-        for _ in range(30):
-            particle = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'speed_y': random.uniform(-0.5, -2.0),
-                'speed_x': random.uniform(-0.2, 0.2),
-                'size': random.randint(2, 5),
-                'color': random.choice([
-                    (255, 100, 50),   # Laranja ardente
-                    (255, 150, 80),   # Laranja claro
-                    (200, 80, 40),    # Vermelho escuro
-                    (255, 200, 100),  # Amarelo quente
-                ]),
-                'life': random.randint(100, 300),
-                'max_life': 300
-            }
-            self.particles.append(particle)
+        ember_colors = [
+            (255, 100, 50),   # Laranja ardente
+            (255, 150, 80),   # Laranja claro
+            (200, 80, 40),    # Vermelho escuro
+            (255, 200, 100),  # Amarelo quente
+        ]
+        # Partículas somem ao passar do topo da tela
+        self.particles = ParticleSystem(bounds=(None, -10, None, None))
+        self.particle_renderer = ParticleRenderer(self.build_particle_sprite)
+        
+        # Leva inicial espalhada pela tela
+        Emitter(self.particles, x=(0, SCREEN_WIDTH), y=(0, SCREEN_HEIGHT),
+                vx=(-0.2, 0.2), vy=(-2.0, -0.5), size=(2, 5), life=(100, 300),
+                max_life=300, colors=ember_colors).emit(30)
+        
+        # Novas partículas subindo da base a cada 20 passos
+        self.ember_emitter = Emitter(self.particles, x=(0, SCREEN_WIDTH), y=SCREEN_HEIGHT + 10,
+                                     vx=(-0.3, 0.3), vy=(-2.5, -0.8), size=(2, 6), life=(150, 400),
+                                     max_life=400, colors=ember_colors, every=20)
         
     def handle_events(self, events):
         mouse_pos = pygame.mouse.get_pos()
@@ -97,34 +105,9 @@ class MenuScene(Scene):
         self.animation_timer += 1
         self.ember_timer += 1
         
-        # Atualizar partículas
-        for particle in self.particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['life'] -= 1
-            
-            # Remover partículas que "morreram" e criar novas
-            if particle['life'] <= 0 or particle['y'] < -10:
-                self.particles.remove(particle)
-        
-        # Criar novas partículas ocasionalmente
-        if self.ember_timer % 20 == 0:
-            new_particle = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': SCREEN_HEIGHT + 10,
-                'speed_y': random.uniform(-0.8, -2.5),
-                'speed_x': random.uniform(-0.3, 0.3),
-                'size': random.randint(2, 6),
-                'color': random.choice([
-                    (255, 100, 50),
-                    (255, 150, 80),
-                    (200, 80, 40),
-                    (255, 200, 100),
-                ]),
-                'life': random.randint(150, 400),
-                'max_life': 400
-            }
-            self.particles.append(new_particle)
+        # Atualizar partículas e emitir novas
+        self.particles.update()
+        self.ember_emitter.update()
         
         # Efeito de brilho no título
         self.title_glow_intensity = 50 + 20 * math.sin(self.animation_timer * 0.05)
@@ -154,58 +137,47 @@ class MenuScene(Scene):
     
     def draw_gradient_background(self, screen):
         """Desenhar fundo gradiente atmosférico"""
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            # Gradiente de azul escuro no topo para vermelho escuro embaixo
-            r = int(15 + (40 - 15) * ratio)
-            g = int(15 + (15 - 15) * ratio)
-            b = int(25 + (15 - 25) * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        screen.blit(self.background, (0, 0))
     
     def draw_particles(self, screen):
-        """Desenhar partículas de ember/fogo"""
-        for particle in self.particles:
-            alpha = int((particle['life'] / particle['max_life']) * 255)
-            
-            # Criar superfície com alpha para transparência
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            
-            # Desenhar partícula com brilho
-            color_with_alpha = (*particle['color'], alpha)
-            pygame.draw.circle(particle_surface, particle['color'], (particle['size'], particle['size']), particle['size'])
-            
-            # Adicionar brilho central
-            if particle['size'] > 2:
-                bright_color = tuple(min(255, c + 50) for c in particle['color'])
-                pygame.draw.circle(particle_surface, bright_color, (particle['size'], particle['size']), particle['size'] // 2)
-            
-            screen.blit(particle_surface, (int(particle['x'] - particle['size']), int(particle['y'] - particle['size'])))
+        """Desenhar partículas de ember/fogo (sprites cacheados, um único lote)"""
+        self.particle_renderer.draw(screen, self.particles)
+    
+    def build_particle_sprite(self, size, color, kind, alpha):
+        """Sprite de um ember: círculo com brilho central nos maiores"""
+        particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(particle_surface, color, (size, size), size)
+        
+        # Adicionar brilho central
+        if size > 2:
+            bright_color = tuple(min(255, c + 50) for c in color)
+            pygame.draw.circle(particle_surface, bright_color, (size, size), size // 2)
+        return particle_surface
     
     def draw_title(self, screen):
         """Desenhar título com efeito de brilho"""
         title_text = "DEMON HUNTER"
         
         # Sombra do título
-        shadow_surface = self.title_font.render(title_text, True, (20, 10, 10))
+        shadow_surface = render_text(title_text, self.title_font_size, (20, 10, 10))
         shadow_rect = shadow_surface.get_rect(center=(SCREEN_WIDTH // 2 + 3, 103))
         screen.blit(shadow_surface, shadow_rect)
         
         # Título principal
-        title_surface = self.title_font.render(title_text, True, self.title_color)
+        title_surface = render_text(title_text, self.title_font_size, self.title_color)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(title_surface, title_rect)
         
         # Efeito de brilho
-        glow_color = (255, 80, 80, int(self.title_glow_intensity))
-        glow_surface = pygame.Surface(title_surface.get_size(), pygame.SRCALPHA)
-        glow_text = self.title_font.render(title_text, True, glow_color[:3])
-        glow_surface.blit(glow_text, (0, 0))
-        screen.blit(glow_surface, title_rect)
+        if self.title_glow is None:
+            self.title_glow = render_text(title_text, self.title_font_size, (255, 80, 80)).copy()
+        self.title_glow.set_alpha(int(self.title_glow_intensity))
+        screen.blit(self.title_glow, title_rect)
     
     def draw_subtitle(self, screen):
         """Desenhar subtítulo atmosférico"""
         subtitle_text = "Sobreviva ao inferno na Terra"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, self.subtitle_color)
+        subtitle_surface = render_text(subtitle_text, self.subtitle_font_size, self.subtitle_color)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 160))
         screen.blit(subtitle_surface, subtitle_rect)
         
@@ -237,8 +209,8 @@ class MenuScene(Scene):
         pygame.draw.rect(screen, self.button_border_color, rect, border_width)
         
         # Texto do botão
-        font_size = self.button_font if is_primary else pygame.font.Font(None, 36)
-        button_text_surface = font_size.render(text, True, self.button_text_color)
+        font_size = self.button_font_size if is_primary else 36
+        button_text_surface = render_text(text, font_size, self.button_text_color)
         text_rect = button_text_surface.get_rect(center=rect.center)
         screen.blit(button_text_surface, text_rect)
         
@@ -260,7 +232,7 @@ class MenuScene(Scene):
         """Desenhar instruções e controles"""
         # Título dos controles
         controls_title = "CONTROLES:"
-        title_surface = pygame.font.Font(None, 32).render(controls_title, True, (200, 150, 150))
+        title_surface = render_text(controls_title, 32, (200, 150, 150))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 140))
         screen.blit(title_surface, title_rect)
         
@@ -284,7 +256,7 @@ class MenuScene(Scene):
         
         y_nav = SCREEN_HEIGHT - 50
         for instruction in nav_instructions:
-            text_surface = self.instruction_font.render(instruction, True, (180, 180, 180))
+            text_surface = render_text(instruction, self.instruction_font_size, (180, 180, 180))
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_nav))
             screen.blit(text_surface, text_rect)
             y_nav += 25
@@ -297,22 +269,21 @@ class MenuScene(Scene):
         item_rect = pygame.Rect(center_x - item_width//2, y - item_height//2, item_width, item_height)
         
         # Desenhar fundo semi-transparente
-        overlay = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
-        overlay.fill((40, 20, 20, 100))
-        screen.blit(overlay, item_rect.topleft)
+        if self.control_overlay is None:
+            self.control_overlay = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
+            self.control_overlay.fill((40, 20, 20, 100))
+        screen.blit(self.control_overlay, item_rect.topleft)
         
         # Borda do item
         pygame.draw.rect(screen, (100, 50, 50), item_rect, 2)
         
         # Texto da tecla (parte superior)
-        key_font = pygame.font.Font(None, 24)
-        key_surface = key_font.render(key_text, True, (255, 200, 150))
+        key_surface = render_text(key_text, 24, (255, 200, 150))
         key_rect = key_surface.get_rect(center=(center_x, y - 12))
         screen.blit(key_surface, key_rect)
         
         # Texto da ação (parte inferior)
-        action_font = pygame.font.Font(None, 20)
-        action_surface = action_font.render(action_text, True, (200, 200, 200))
+        action_surface = render_text(action_text, 20, (200, 200, 200))
         action_rect = action_surface.get_rect(center=(center_x, y + 8))
         screen.blit(action_surface, action_rect)
         
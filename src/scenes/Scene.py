@@ -7,10 +7,17 @@ class Scene:
         self.game = game
         self.next_scene = None
         
+        # Fração entre o último e o próximo passo da simulação (0..1)
+        self.interpolation = 1.0
+        
     def handle_events(self, events):
         """Lidar com eventos da cena"""
         pass
         
+    def save_previous_state(self):
+        """Guardar estado antes do passo de simulação (para interpolação)"""
+        pass
+        
     def update(self):
         """Atualizar lógica da cena"""
         pass
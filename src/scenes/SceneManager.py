@@ -6,6 +6,10 @@ class SceneManager:
         self.game = game
         self.current_scene = MenuScene(game)  # Começar no menu
         
+    def set_scene(self, scene):
+        """Trocar diretamente para outra cena"""
+        self.current_scene = scene
+        
     def handle_events(self, events):
         self.current_scene.handle_events(events)
         
@@ -14,7 +18,9 @@ class SceneManager:
             self.current_scene = self.current_scene.next_scene
             
     def update(self):
+        self.current_scene.save_previous_state()
         self.current_scene.update()
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        self.current_scene.interpolation = alpha
         self.current_scene.draw(screen)
\ No newline at end of file
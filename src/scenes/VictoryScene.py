@@ -1,37 +1,67 @@
 import pygame
 import math
 from scenes.Scene import Scene
+from utils.gradients import get_vertical_gradient
+from utils.fonts import render_text
+from utils.particles import ParticleSystem, Emitter, ParticleRenderer
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class VictoryScene(Scene):
     def __init__(self, game):
         super().__init__(game)
         self.animation_timer = 0
-        self.sparkle_particles = []
         self.victory_message_timer = 0
         
-        # Criar algumas partículas de comemoração
-        self.create_sparkles()
+        # Título e sombra escalados por nível de pulsação (o tamanho se repete a cada ciclo)
+        self.title_frames = {}
+        
+        # Mensagens de parabéns, uma cópia própria de cada (alpha muda por quadro)
+        messages = [
+            "Parabéns, guerreiro!",
+            "Você derrotou todos os demônios!",
+            "A terra está segura novamente!"
+        ]
+        self.message_surfaces = [render_text(message, 48, (255, 255, 255)).copy() for message in messages]
+        
+        # Fundo gradiente celebrativo: topo azul escuro, base dourada
+        self.background = get_vertical_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), [(25, 25, 112), (94, 158, 0)])
+        
+        # Partículas de comemoração: a vida (255) cai 2 por passo e vira o alpha
+        self.sparkle_particles = ParticleSystem(decay=2)
+        self.sparkle_renderer = ParticleRenderer(self.build_sparkle_sprite)
+        self.sparkle_emitter = Emitter(self.sparkle_particles, x=(0, SCREEN_WIDTH), y=(0, SCREEN_HEIGHT),
+                                       vx=(-2.0, 2.0), vy=(-3.0, -1.0), size=3, life=255, max_life=255,
+                                       colors=[
+                                           (255, 215, 0),   # Dourado
+                                           (255, 255, 255), # Branco
+                                           (255, 192, 203), # Rosa
+                                           (173, 216, 230), # Azul claro
+                                       ], rate=50, every=30)
         
-    def create_sparkles(self):
-        """Criar partículas de comemoração"""
-        import random
-        for _ in range(50):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            speed_x = random.uniform(-2, 2)
-            speed_y = random.uniform(-3, -1)
-            color = random.choice([
-                (255, 215, 0),   # Dourado
-                (255, 255, 255), # Branco
-                (255, 192, 203), # Rosa
-                (173, 216, 230), # Azul claro
-            ])
-            self.sparkle_particles.append({
-                'x': x, 'y': y, 
-                'speed_x': speed_x, 'speed_y': speed_y,
-                'color': color, 'life': 255
-            })
+        # Criar algumas partículas de comemoração
+        self.sparkle_emitter.emit()
+    
+    def build_sparkle_sprite(self, size, color, kind, alpha):
+        """Sprite de uma pequena estrela, com brilho branco enquanto ainda é forte"""
+        sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (size, size), size)
+        if alpha > 128:
+            pygame.draw.circle(sprite, (255, 255, 255), (size, size), 1)
+        return sprite
+    
+    def get_title_frame(self, pulse):
+        """Título e sombra escalados, arredondando a pulsação para passos de 0.5%"""
+        level = round((pulse - 1.0) * 200)
+        frame = self.title_frames.get(level)
+        if frame is None:
+            scale = 1.0 + level / 200
+            texts = (render_text("VITÓRIA!", 128, (255, 215, 0)), render_text("VITÓRIA!", 128, (139, 69, 19)))
+            frame = tuple(
+                pygame.transform.scale(text, (int(text.get_width() * scale), int(text.get_height() * scale)))
+                for text in texts
+            )
+            self.title_frames[level] = frame
+        return frame
     
     def handle_events(self, events):
         for event in events:
@@ -49,103 +79,49 @@ class VictoryScene(Scene):
         self.animation_timer += 1
         self.victory_message_timer += 1
         
-        # Atualizar partículas
-        for particle in self.sparkle_particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['life'] -= 2
-            
-            # Remover partículas que "morreram"
-            if particle['life'] <= 0:
-                self.sparkle_particles.remove(particle)
-        
-        # Criar novas partículas ocasionalmente
-        if self.animation_timer % 30 == 0:
-            self.create_sparkles()
+        # Atualizar partículas e criar novas a cada 30 passos
+        self.sparkle_particles.update()
+        self.sparkle_emitter.update()
     
     def draw(self, screen):
         # Fundo gradiente celebrativo
-        for y in range(SCREEN_HEIGHT):
-            # Gradiente do topo (azul escuro) para baixo (dourado)
-            ratio = y / SCREEN_HEIGHT
-            r = int(25 + (255 - 25) * ratio * 0.3)
-            g = int(25 + (215 - 25) * ratio * 0.7)
-            b = int(112 - 112 * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        screen.blit(self.background, (0, 0))
         
         # Desenhar partículas de comemoração
-        for particle in self.sparkle_particles:
-            alpha = max(0, particle['life'])
-            color = (*particle['color'][:3], alpha)
-            
-            # Desenhar uma pequena estrela
-            star_size = 3
-            star_x = int(particle['x'])
-            star_y = int(particle['y'])
-            
-            pygame.draw.circle(screen, particle['color'], (star_x, star_y), star_size)
-            # Adicionar brilho
-            if alpha > 128:
-                pygame.draw.circle(screen, (255, 255, 255), (star_x, star_y), 1)
+        self.sparkle_renderer.draw(screen, self.sparkle_particles)
         
         # Título principal "VITÓRIA!"
-        font_title = pygame.font.Font(None, 128)
-        
         # Efeito de pulsação no título
         pulse = 1.0 + 0.1 * abs(math.cos(self.animation_timer * 0.1))
         
-        victory_text = font_title.render("VITÓRIA!", True, (255, 215, 0))
-        victory_scaled = pygame.transform.scale(
-            victory_text, 
-            (int(victory_text.get_width() * pulse), int(victory_text.get_height() * pulse))
-        )
+        victory_scaled, shadow_scaled = self.get_title_frame(pulse)
         victory_rect = victory_scaled.get_rect(center=(SCREEN_WIDTH // 2, 150))
         
         # Sombra do título
-        shadow_text = font_title.render("VITÓRIA!", True, (139, 69, 19))
-        shadow_scaled = pygame.transform.scale(
-            shadow_text, 
-            (int(shadow_text.get_width() * pulse), int(shadow_text.get_height() * pulse))
-        )
         shadow_rect = shadow_scaled.get_rect(center=(SCREEN_WIDTH // 2 + 3, 153))
         screen.blit(shadow_scaled, shadow_rect)
         screen.blit(victory_scaled, victory_rect)
         
         # Mensagem de parabéns
-        font_message = pygame.font.Font(None, 48)
-        messages = [
-            "Parabéns, guerreiro!",
-            "Você derrotou todos os demônios!",
-            "A terra está segura novamente!"
-        ]
-        
         y_offset = 280
-        for i, message in enumerate(messages):
+        for i, message_surface in enumerate(self.message_surfaces):
             # Fazer as mensagens aparecerem gradualmente
             if self.victory_message_timer > i * 60:
                 alpha = min(255, (self.victory_message_timer - i * 60) * 5)
-                
-                # Criar superfície para aplicar alpha
-                message_surface = font_message.render(message, True, (255, 255, 255))
-                alpha_surface = pygame.Surface(message_surface.get_size(), pygame.SRCALPHA)
-                alpha_surface.fill((255, 255, 255, alpha))
-                alpha_surface.blit(message_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                
-                message_rect = alpha_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                screen.blit(alpha_surface, message_rect)
+                message_surface.set_alpha(alpha)
+                message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+                screen.blit(message_surface, message_rect)
             
             y_offset += 60
         
         # Estatísticas (opcional - pode ser expandido futuramente)
         if self.victory_message_timer > 240:  # Após 4 segundos
-            font_stats = pygame.font.Font(None, 32)
-            stats_text = font_stats.render("Missão Completa!", True, (173, 216, 230))
+            stats_text = render_text("Missão Completa!", 32, (173, 216, 230))
             stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH // 2, 480))
             screen.blit(stats_text, stats_rect)
         
         # Instruções
         if self.victory_message_timer > 300:  # Após 5 segundos
-            font_instructions = pygame.font.Font(None, 28)
             instructions = [
                 "Pressione R para jogar novamente",
                 "Pressione ESC para voltar ao menu principal"
@@ -153,7 +129,7 @@ class VictoryScene(Scene):
             
             y_offset = 550
             for instruction in instructions:
-                text = font_instructions.render(instruction, True, (200, 200, 200))
+                text = render_text(instruction, 28, (200, 200, 200))
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
                 screen.blit(text, text_rect)
                 y_offset += 35
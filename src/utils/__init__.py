@@ -1,3 +1,14 @@
 from . import assets_loader
+from . import profiler
+from . import gradients
+from . import post_processing
+from . import fonts
+from . import animation_atlas
+from . import sprite_registry
+from . import asset_manager
+from . import broadphase
+from . import camera
+from . import lighting
+from . import particles
 
-__all__ = ['assets_loader']
\ No newline at end of file
+__all__ = ['assets_loader', 'profiler', 'gradients', 'post_processing', 'fonts', 'animation_atlas', 'sprite_registry', 'asset_manager', 'broadphase', 'camera', 'lighting', 'particles']
\ No newline at end of file
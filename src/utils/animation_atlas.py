@@ -0,0 +1,34 @@
+import pygame
+
+class AnimationAtlas:
+    """Frames de todas as animações já recortados, escalados e convertidos
+    
+    Cada (animação, frame, espelhado) é montado uma vez no carregamento;
+    trocar de frame vira apenas uma consulta por índice.
+    """
+    
+    def __init__(self, spritesheet, animations, frame_size):
+        self.frame_size = frame_size
+        self.frames = {}  # (nome da animação, espelhado) -> tupla de superfícies
+        
+        for name, animation in animations.items():
+            frames = tuple(self.bake_frame(spritesheet, frame_data) for frame_data in animation["frames"])
+            self.frames[(name, False)] = frames
+            self.frames[(name, True)] = tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+    
+    def bake_frame(self, spritesheet, frame_data):
+        """Recortar um frame do spritesheet e escalar para o tamanho final"""
+        frame_rect = pygame.Rect(frame_data["x"], frame_data["y"],
+                                 frame_data["width"], frame_data["height"])
+        frame_surface = pygame.Surface((frame_data["width"], frame_data["height"]), pygame.SRCALPHA)
+        frame_surface.blit(spritesheet, (0, 0), frame_rect)
+        
+        scaled_frame = pygame.transform.scale(frame_surface, self.frame_size)
+        
+        # Converter para o formato do display deixa os blits mais rápidos
+        if pygame.display.get_surface() is not None:
+            scaled_frame = scaled_frame.convert_alpha()
+        return scaled_frame
+    
+    def get_frame(self, animation, index, flipped=False):
+        return self.frames[(animation, flipped)][index]
\ No newline at end of file
@@ -0,0 +1,91 @@
+import os
+import time
+import pygame
+from utils.assets_loader import get_resource_path
+
+class AssetManager:
+    """Carrega cada imagem uma única vez, já convertida para o formato do display
+    
+    Os caminhos são resolvidos uma vez por nome e as superfícies ficam em
+    cache pelo caminho resolvido. As superfícies são compartilhadas e não
+    devem ser modificadas por quem as recebe.
+    """
+    
+    def __init__(self):
+        self.paths = {}    # nome pedido -> caminho resolvido (None se não existe)
+        self.images = {}   # (caminho resolvido, alpha) -> superfície
+        self.records = {}  # (caminho resolvido, alpha) -> estatísticas de carregamento
+    
+    def resolve(self, file_path):
+        """Resolver o caminho de um arquivo da pasta assets (com cache)"""
+        if file_path in self.paths:
+            return self.paths[file_path]
+        
+        capitalized_name = file_path.title()
+        candidates = [
+            get_resource_path(os.path.join("assets", file_path)),
+            # Tenta com o nome em maiúsculo (Player.png ao invés de player.png)
+            get_resource_path(os.path.join("assets", capitalized_name)),
+            # Tenta apenas o caminho relativo para desenvolvimento
+            os.path.join("assets", file_path),
+            os.path.join("assets", capitalized_name),
+        ]
+        resolved = None
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                resolved = candidate
+                break
+        
+        self.paths[file_path] = resolved
+        return resolved
+    
+    def get_image(self, file_path, alpha=True):
+        """Obter imagem convertida (convert_alpha, ou convert se alpha=False)"""
+        full_path = self.resolve(file_path)
+        key = (full_path or file_path, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+        
+        start = time.perf_counter()
+        if full_path is None:
+            print(f"Aviso: Imagem não encontrada: {file_path}")
+            image = self.create_placeholder()
+        else:
+            try:
+                image = pygame.image.load(full_path)
+            except pygame.error as e:
+                print(f"Erro ao carregar {file_path}: {e}")
+                image = self.create_placeholder()
+        image = image.convert_alpha() if alpha else image.convert()
+        
+        self.images[key] = image
+        self.records[key] = {
+            'name': file_path,
+            'path': full_path,
+            'size': image.get_size(),
+            'bytes': image.get_width() * image.get_height() * image.get_bytesize(),
+            'load_ms': (time.perf_counter() - start) * 1000
+        }
+        return image
+    
+    def create_placeholder(self):
+        # Magenta para indicar erro
+        placeholder = pygame.Surface((64, 64))
+        placeholder.fill((255, 0, 255))
+        return placeholder
+    
+    def get_report(self):
+        """Tempo de carregamento e memória de cada imagem carregada"""
+        return [dict(record) for record in self.records.values()]
+    
+    def total_bytes(self):
+        return sum(record['bytes'] for record in self.records.values())
+    
+    def clear(self):
+        self.paths.clear()
+        self.images.clear()
+        self.records.clear()
+
+# Gerenciador compartilhado por todo o jogo
+assets = AssetManager()
\ No newline at end of file
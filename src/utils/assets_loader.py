@@ -1,4 +1,3 @@
-import pygame
 import os
 import sys
 
@@ -14,39 +13,10 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 def load_image(file_path):
-    """Carregar imagem com caminho correto para desenvolvimento e exe"""
-    # Primeiro tenta o caminho completo via get_resource_path
-    full_path = get_resource_path(os.path.join("assets", file_path))
+    """Carregar imagem com caminho correto para desenvolvimento e exe
     
-    # Se não encontrar, tenta variações do nome do arquivo
-    if not os.path.exists(full_path):
-        # Tenta com o nome em maiúsculo (Player.png ao invés de player.png)
-        capitalized_name = file_path.title()
-        alt_path = get_resource_path(os.path.join("assets", capitalized_name))
-        if os.path.exists(alt_path):
-            full_path = alt_path
-        else:
-            # Tenta apenas o caminho relativo para desenvolvimento
-            dev_path = os.path.join("assets", file_path)
-            if os.path.exists(dev_path):
-                full_path = dev_path
-            else:
-                # Tenta o nome capitalizado no desenvolvimento
-                dev_cap_path = os.path.join("assets", capitalized_name)
-                if os.path.exists(dev_cap_path):
-                    full_path = dev_cap_path
-                else:
-                    # Criar uma imagem placeholder se não encontrar
-                    print(f"Aviso: Imagem não encontrada: {file_path}")
-                    placeholder = pygame.Surface((64, 64))
-                    placeholder.fill((255, 0, 255))  # Magenta para indicar erro
-                    return placeholder.convert_alpha()
-    
-    try:
-        return pygame.image.load(full_path).convert_alpha()
-    except pygame.error as e:
-        print(f"Erro ao carregar {file_path}: {e}")
-        # Retornar placeholder em caso de erro
-        placeholder = pygame.Surface((64, 64))
-        placeholder.fill((255, 0, 255))
-        return placeholder.convert_alpha()
\ No newline at end of file
+    Delegado ao AssetManager: cada imagem é resolvida, carregada e
+    convertida uma única vez.
+    """
+    from utils.asset_manager import assets
+    return assets.get_image(file_path)
\ No newline at end of file
@@ -0,0 +1,99 @@
+import pygame
+
+def rect_left(sprite):
+    return sprite.rect.left
+
+class TrackedGroup(pygame.sprite.Group):
+    """Group que conta as mudanças de membros (add, remove e kill)
+
+    A broadphase compara `version` para saber se a sua lista ainda tem
+    exatamente os sprites do grupo, sem percorrer o grupo a cada passo.
+    """
+    
+    def __init__(self, *sprites):
+        self.version = 0
+        super().__init__(*sprites)
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.version += 1
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.version += 1
+
+class SweepAndPrune:
+    """Broadphase por varredura no eixo x (sweep and prune)
+    
+    Mantém os sprites ordenados pela borda esquerda entre quadros. Como
+    eles se movem pouco por passo, a lista fica quase ordenada e o sort
+    custa perto de O(n). Só pares cujos intervalos em x se sobrepõem
+    viram candidatos para o teste exato.
+    """
+    
+    def __init__(self):
+        self.items = []
+        self.max_width = 0
+        self.group = None
+        self.version = None
+    
+    def sync(self, group):
+        """Refazer a lista só se os membros do grupo mudaram
+        
+        Com um TrackedGroup a checagem é pela versão; outros grupos são
+        copiados sempre.
+        """
+        version = getattr(group, 'version', None)
+        if group is self.group and version is not None and version == self.version:
+            return
+        self.items = list(group)
+        self.group = group
+        self.version = version
+        self.max_width = max((sprite.rect.width for sprite in self.items), default=0)
+    
+    def sort(self):
+        """Reordenar pelo x atual (quase ordenada entre passos, perto de O(n))"""
+        self.items.sort(key=rect_left)
+    
+    def update(self, group):
+        """Sincronizar com o grupo e reordenar pelo x atual"""
+        self.sync(group)
+        self.sort()
+    
+    def pairs(self):
+        """Pares candidatos (a, b) com sobreposição no eixo x"""
+        items = self.items
+        count = len(items)
+        candidates = []
+        for i in range(count):
+            first = items[i]
+            right = first.rect.right
+            for j in range(i + 1, count):
+                second = items[j]
+                if second.rect.left >= right:
+                    break
+                candidates.append((first, second))
+        return candidates
+    
+    def query(self, rect):
+        """Sprites cujo intervalo em x se sobrepõe ao do retângulo"""
+        items = self.items
+        
+        # Busca binária pelo primeiro sprite que ainda pode alcançar rect.left
+        start_left = rect.left - self.max_width
+        low, high = 0, len(items)
+        while low < high:
+            middle = (low + high) // 2
+            if items[middle].rect.left <= start_left:
+                low = middle + 1
+            else:
+                high = middle
+        
+        candidates = []
+        for index in range(low, len(items)):
+            sprite = items[index]
+            if sprite.rect.left >= rect.right:
+                break
+            if sprite.rect.right > rect.left:
+                candidates.append(sprite)
+        return candidates
\ No newline at end of file
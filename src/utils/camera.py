@@ -0,0 +1,102 @@
+import math
+import numpy
+import pygame
+
+class Camera:
+    """Câmera com suavização, interpolação do desenho e culling
+
+    A posição (x, y) avança no passo da simulação. A cada quadro,
+    begin_frame calcula o deslocamento interpolado usado no desenho e o
+    retângulo visível em coordenadas do mundo. Os métodos de culling usam
+    esse retângulo e contam o que foi desenhado e o que foi descartado
+    por categoria.
+    """
+
+    def __init__(self, width, height, smooth=0.1):
+        self.width = width
+        self.height = height
+        self.smooth = smooth
+        self.x = 0
+        self.y = 0
+        self.prev_x = 0
+        self.prev_y = 0
+        self.offset = (0, 0)
+        self.view = pygame.Rect(0, 0, width, height)
+        self.counts = {}  # categoria -> [desenhados, descartados]
+
+    def target_for(self, target_rect, level_width, level_height):
+        """Posição que centraliza o alvo, limitada às bordas do level"""
+        target_x = target_rect.centerx - self.width // 2
+        target_y = target_rect.centery - self.height // 2
+
+        target_x = max(0, min(target_x, level_width - self.width))
+        target_y = max(0, min(target_y, level_height - self.height))
+        return target_x, target_y
+
+    def follow(self, target_rect, level_width, level_height):
+        """Aproximar a câmera do alvo sem sair dos limites do level"""
+        target_x, target_y = self.target_for(target_rect, level_width, level_height)
+        self.x += (target_x - self.x) * self.smooth
+        self.y += (target_y - self.y) * self.smooth
+
+    def snap(self, target_rect, level_width, level_height):
+        """Pular direto para o alvo, sem suavização (início da cena)"""
+        self.x, self.y = self.target_for(target_rect, level_width, level_height)
+        self.save_previous_state()
+
+    def save_previous_state(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def begin_frame(self, interpolation=1.0):
+        """Posição interpolada e retângulo visível do quadro; zera os contadores"""
+        offset_x = self.prev_x + (self.x - self.prev_x) * interpolation
+        offset_y = self.prev_y + (self.y - self.prev_y) * interpolation
+        self.offset = (offset_x, offset_y)
+        # Um pixel a mais cobre o arredondamento da posição na tela
+        self.view = pygame.Rect(math.floor(offset_x), math.floor(offset_y), self.width + 1, self.height + 1)
+        for count in self.counts.values():
+            count[0] = count[1] = 0
+        return self.offset
+
+    def visible_rect(self, margin=0):
+        """Retângulo visível no mundo, opcionalmente expandido por uma margem"""
+        return self.view.inflate(margin * 2, margin * 2) if margin else self.view
+
+    def record(self, category, drawn, culled):
+        count = self.counts.get(category)
+        if count is None:
+            count = self.counts[category] = [0, 0]
+        count[0] += drawn
+        count[1] += culled
+
+    def is_visible(self, rect, category=None, margin=0):
+        visible = self.visible_rect(margin).colliderect(rect)
+        if category is not None:
+            self.record(category, int(visible), int(not visible))
+        return visible
+
+    def cull(self, sprites, category, margin=0, candidates=None):
+        """Sprites visíveis de um grupo
+
+        candidates: lista já filtrada por uma estrutura espacial (por
+        exemplo SweepAndPrune.query); os demais contam como descartados.
+        """
+        view = self.visible_rect(margin)
+        total = len(sprites)
+        source = sprites if candidates is None else candidates
+        visible = [sprite for sprite in source if sprite.alive() and view.colliderect(sprite.rect)]
+        self.record(category, len(visible), total - len(visible))
+        return visible
+
+    def cull_boxes(self, xs, ys, width, height, category, margin=0):
+        """Máscara NumPy dos retângulos (xs, ys, width, height) visíveis"""
+        view = self.visible_rect(margin)
+        mask = (xs < view.right) & (xs + width > view.left) & (ys < view.bottom) & (ys + height > view.top)
+        drawn = int(numpy.count_nonzero(mask))
+        self.record(category, drawn, len(mask) - drawn)
+        return mask
+
+    def get_stats(self):
+        """Contadores do último quadro: categoria -> (desenhados, descartados)"""
+        return {category: tuple(count) for category, count in self.counts.items()}
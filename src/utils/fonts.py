@@ -0,0 +1,61 @@
+from collections import OrderedDict
+import pygame
+
+# Fontes carregadas uma única vez por (nome, tamanho)
+_fonts = {}
+
+# Cache LRU de textos renderizados: (fonte, texto, cor, antialias) -> superfície
+_text_cache = OrderedDict()
+_max_cached_texts = 512
+_text_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+def get_font(size, name=None):
+    """Fonte compartilhada para o tamanho pedido (None = fonte padrão do pygame)"""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+def render_text(text, size, color, antialias=True, name=None):
+    """Renderizar texto usando o cache; a superfície retornada é compartilhada
+    
+    Quem chama não deve desenhar sobre ela (blit a partir dela é seguro).
+    """
+    key = ((name, size), text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_stats['hits'] += 1
+        _text_cache.move_to_end(key)
+        return surface
+    
+    _text_stats['misses'] += 1
+    surface = get_font(size, name).render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > _max_cached_texts:
+        _text_cache.popitem(last=False)
+        _text_stats['evictions'] += 1
+    return surface
+
+def set_text_cache_size(max_entries):
+    global _max_cached_texts
+    _max_cached_texts = max_entries
+    while len(_text_cache) > _max_cached_texts:
+        _text_cache.popitem(last=False)
+        _text_stats['evictions'] += 1
+
+def get_text_stats():
+    """Contadores de acertos/faltas do cache de textos"""
+    return {
+        'hits': _text_stats['hits'],
+        'misses': _text_stats['misses'],
+        'evictions': _text_stats['evictions'],
+        'entries': len(_text_cache),
+        'fonts': len(_fonts)
+    }
+
+def clear_text_cache():
+    _text_cache.clear()
+    for counter in _text_stats:
+        _text_stats[counter] = 0
\ No newline at end of file
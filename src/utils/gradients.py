@@ -0,0 +1,40 @@
+import numpy
+import pygame
+
+# Cache compartilhado: (tamanho, cores) -> superfície pronta para blit
+_gradient_cache = {}
+
+def get_vertical_gradient(size, stops):
+    """Gradiente vertical cacheado, construído uma única vez por (tamanho, cores)
+    
+    stops: sequência de cores RGB distribuídas igualmente do topo até a base.
+    A superfície retornada é compartilhada e não deve ser modificada.
+    """
+    key = (tuple(size), tuple(tuple(color) for color in stops))
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        surface = build_vertical_gradient(key[0], key[1])
+        _gradient_cache[key] = surface
+    return surface
+
+def build_vertical_gradient(size, stops):
+    """Construir o gradiente com surfarray (uma coluna interpolada replicada na largura)"""
+    width, height = size
+    ratio = numpy.arange(height) / height
+    positions = numpy.linspace(0.0, 1.0, len(stops))
+    
+    column = numpy.empty((height, 3))
+    for channel in range(3):
+        column[:, channel] = numpy.interp(ratio, positions, [color[channel] for color in stops])
+    column = column.astype(numpy.uint8)
+    
+    pixels = numpy.repeat(column[numpy.newaxis, :, :], width, axis=0)
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, pixels)
+    
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+def clear_gradient_cache():
+    _gradient_cache.clear()
\ No newline at end of file
@@ -0,0 +1,95 @@
+import numpy
+import pygame
+
+class LightMap:
+    """Mapa de luz em grade grossa somado à tela com BLEND_RGB_ADD
+
+    Cada luz (posição na tela, raio, cor) acumula nas células da grade
+    com queda quadrática. A grade é suavizada para a resolução da tela só
+    nas regiões que têm luz (luzes que se tocam dividem uma região),
+    sempre dentro de buffers persistentes: nenhuma superfície é criada
+    por quadro.
+    """
+
+    def __init__(self, size, cell_size=32):
+        self.width, self.height = size
+        self.cell_size = cell_size
+        self.cols = -(-self.width // cell_size)
+        self.rows = -(-self.height // cell_size)
+
+        # Buffers persistentes (grade em float, grade em bytes e superfícies)
+        self.grid = numpy.zeros((self.cols, self.rows, 3), dtype=numpy.float32)
+        self.pixels = numpy.zeros((self.cols, self.rows, 3), dtype=numpy.uint8)
+        self.cell_x = (numpy.arange(self.cols, dtype=numpy.float32) + 0.5) * cell_size
+        self.cell_y = (numpy.arange(self.rows, dtype=numpy.float32) + 0.5) * cell_size
+        self.small = pygame.Surface((self.cols, self.rows))
+        self.buffer = pygame.Surface((self.cols * cell_size, self.rows * cell_size))
+        if pygame.display.get_surface() is not None:
+            self.small = self.small.convert()
+            self.buffer = self.buffer.convert()
+
+        self.regions = []  # [primeira coluna, primeira linha, última coluna, última linha]
+        self.light_count = 0
+
+    def clear(self):
+        for first_col, first_row, last_col, last_row in self.regions:
+            self.grid[first_col:last_col + 1, first_row:last_row + 1] = 0
+        self.regions.clear()
+        self.light_count = 0
+
+    def add_light(self, x, y, radius, color, intensity=1.0):
+        """Somar uma luz centrada em (x, y), em coordenadas da tela"""
+        size = self.cell_size
+        first_col = max(0, int((x - radius) // size))
+        last_col = min(self.cols - 1, int((x + radius) // size))
+        first_row = max(0, int((y - radius) // size))
+        last_row = min(self.rows - 1, int((y + radius) // size))
+        if first_col > last_col or first_row > last_row:
+            return
+
+        dx = (self.cell_x[first_col:last_col + 1] - x)[:, numpy.newaxis]
+        dy = (self.cell_y[first_row:last_row + 1] - y)[numpy.newaxis, :]
+        falloff = numpy.clip(1.0 - (dx * dx + dy * dy) / (radius * radius), 0.0, 1.0)
+        falloff *= falloff * intensity
+
+        block = self.grid[first_col:last_col + 1, first_row:last_row + 1]
+        for channel in range(3):
+            block[:, :, channel] += falloff * color[channel]
+
+        self.mark_region(max(0, first_col - 1), max(0, first_row - 1),
+                         min(self.cols - 1, last_col + 1), min(self.rows - 1, last_row + 1))
+        self.light_count += 1
+
+    def mark_region(self, first_col, first_row, last_col, last_row):
+        """Registrar uma área suja, unindo com as regiões que ela toca"""
+        region = [first_col, first_row, last_col, last_row]
+        merged = True
+        while merged:
+            merged = False
+            for other in self.regions:
+                if (region[0] <= other[2] and other[0] <= region[2] and
+                        region[1] <= other[3] and other[1] <= region[3]):
+                    region = [min(region[0], other[0]), min(region[1], other[1]),
+                              max(region[2], other[2]), max(region[3], other[3])]
+                    self.regions.remove(other)
+                    merged = True
+                    break
+        self.regions.append(region)
+
+    def draw(self, screen):
+        """Somar a luz acumulada na tela"""
+        if not self.regions:
+            return
+        for first_col, first_row, last_col, last_row in self.regions:
+            region = (slice(first_col, last_col + 1), slice(first_row, last_row + 1))
+            numpy.minimum(self.grid[region], 255, out=self.grid[region])
+            self.pixels[region] = self.grid[region]
+        pygame.surfarray.blit_array(self.small, self.pixels)
+
+        # Cada região (com uma célula de folga para a suavização) vira um blit aditivo
+        size = self.cell_size
+        for first_col, first_row, last_col, last_row in self.regions:
+            cells = pygame.Rect(first_col, first_row, last_col - first_col + 1, last_row - first_row + 1)
+            area = pygame.Rect(cells.x * size, cells.y * size, cells.width * size, cells.height * size)
+            pygame.transform.smoothscale(self.small.subsurface(cells), area.size, self.buffer.subsurface(area))
+            screen.blit(self.buffer, area.topleft, area, special_flags=pygame.BLEND_RGB_ADD)
@@ -0,0 +1,248 @@
+import random
+import numpy
+import pygame
+
+class ParticleSystem:
+    """Partículas em arrays NumPy (struct of arrays)
+
+    Posição, velocidade, gravidade, vida, tamanho, cor e tipo ficam em
+    arrays paralelos. O update move, aplica gravidade e desconta a vida de
+    todas as partículas de uma vez; as que morrem (ou saem dos limites)
+    são removidas por compactação, sem remover itens de listas.
+    """
+
+    FIELDS = (
+        ('x', numpy.float32), ('y', numpy.float32),
+        ('vx', numpy.float32), ('vy', numpy.float32),
+        ('gravity', numpy.float32),
+        ('life', numpy.float32), ('max_life', numpy.float32),
+        ('size', numpy.int16), ('kind', numpy.uint8)
+    )
+
+    def __init__(self, capacity=256, decay=1, bounds=None):
+        self.decay = decay
+        # Limites (esquerda, topo, direita, base); None desliga aquele lado
+        self.bounds = bounds or (None, None, None, None)
+        self.count = 0
+        self.capacity = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Criar (ou aumentar) os arrays mantendo as partículas vivas"""
+        for name, dtype in self.FIELDS:
+            array = numpy.zeros(capacity, dtype=dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        color = numpy.zeros((capacity, 3), dtype=numpy.uint8)
+        if self.count:
+            color[:self.count] = self.color[:self.count]
+        self.color = color
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, count, x, y, vx, vy, size, life, max_life, color, gravity=0.0, kind=0):
+        """Criar `count` partículas; cada valor pode ser escalar ou array com `count` itens"""
+        if count <= 0:
+            return
+        needed = self.count + count
+        if needed > self.capacity:
+            capacity = max(self.capacity, 16)
+            while capacity < needed:
+                capacity *= 2
+            self.allocate(capacity)
+
+        new = slice(self.count, needed)
+        self.x[new] = x
+        self.y[new] = y
+        self.vx[new] = vx
+        self.vy[new] = vy
+        self.size[new] = size
+        self.life[new] = life
+        self.max_life[new] = max_life
+        self.color[new] = color
+        self.gravity[new] = gravity
+        self.kind[new] = kind
+        self.count = needed
+
+    def remove(self, dead):
+        """Compactar os arrays descartando as partículas marcadas em `dead`"""
+        if not dead.any():
+            return
+        keep = ~dead
+        alive = int(numpy.count_nonzero(keep))
+        for name, _ in self.FIELDS:
+            array = getattr(self, name)
+            array[:alive] = array[:self.count][keep]
+        self.color[:alive] = self.color[:self.count][keep]
+        self.count = alive
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        self.vy[:n] += self.gravity[:n]
+        life = self.life[:n]
+        life -= self.decay
+
+        dead = life <= 0
+        left, top, right, bottom = self.bounds
+        if left is not None:
+            dead |= x < left
+        if top is not None:
+            dead |= y < top
+        if right is not None:
+            dead |= x > right
+        if bottom is not None:
+            dead |= y > bottom
+        self.remove(dead)
+
+    def life_ratio(self):
+        """Fração de vida restante (0 a 1) de cada partícula viva"""
+        n = self.count
+        return numpy.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+
+def sample(rng, value, count):
+    """Sortear `count` valores: (mín, máx) inteiros ou reais, ou um valor fixo"""
+    if isinstance(value, tuple):
+        low, high = value
+        if isinstance(low, int) and isinstance(high, int):
+            return rng.integers(low, high + 1, count)
+        return rng.uniform(low, high, count)
+    return value
+
+class Emitter:
+    """Fonte de partículas com parâmetros sorteados para um ParticleSystem
+
+    Cada parâmetro pode ser fixo ou um intervalo (mín, máx). `kinds` lista
+    os tipos possíveis e `gravity` pode ser um valor por tipo. No update a
+    emissão acontece a cada `every` passos, com probabilidade `chance` e
+    só enquanto o sistema tiver menos de `max_alive` partículas.
+    """
+
+    def __init__(self, system, x, y, vx, vy, size, life, max_life, colors,
+                 gravity=0.0, kinds=(0,), rate=1, every=1, chance=1.0, max_alive=None):
+        self.system = system
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+        self.life = life
+        self.max_life = max_life
+        self.colors = numpy.array(colors, dtype=numpy.uint8)
+        self.kinds = numpy.array(kinds, dtype=numpy.uint8)
+        self.gravity = numpy.broadcast_to(numpy.asarray(gravity, dtype=numpy.float32), (len(kinds),))
+        self.rate = rate
+        self.every = every
+        self.chance = chance
+        self.max_alive = max_alive
+        self.timer = 0
+        # Gerador próprio, semeado pelo random global (reproduzível com random.seed)
+        self.rng = numpy.random.default_rng(random.getrandbits(32))
+
+    def emit(self, count=None):
+        count = self.rate if count is None else count
+        rng = self.rng
+        kind_index = rng.integers(0, len(self.kinds), count)
+        self.system.spawn(
+            count,
+            sample(rng, self.x, count), sample(rng, self.y, count),
+            sample(rng, self.vx, count), sample(rng, self.vy, count),
+            sample(rng, self.size, count), sample(rng, self.life, count),
+            self.max_life,
+            self.colors[rng.integers(0, len(self.colors), count)],
+            self.gravity[kind_index], self.kinds[kind_index]
+        )
+
+    def update(self):
+        self.timer += 1
+        if self.timer % self.every:
+            return
+        if self.max_alive is not None and len(self.system) >= self.max_alive:
+            return
+        if self.chance < 1.0 and self.rng.random() >= self.chance:
+            return
+        self.emit()
+
+class ParticleRenderer:
+    """Desenho em lote das partículas de um ParticleSystem
+
+    Os sprites vêm de um cache por (tipo, tamanho, cor, faixa de alpha),
+    criados por build_sprite(size, color, kind, alpha) na primeira vez
+    que aparecem; o alpha da faixa (vida restante × max_alpha) é aplicado
+    ao sprite. O quadro inteiro vira uma única chamada fblits/blits.
+    """
+
+    def __init__(self, build_sprite, alpha_buckets=16, max_alpha=255):
+        self.build_sprite = build_sprite
+        self.alpha_buckets = alpha_buckets
+        self.max_alpha = max_alpha
+        self.cache = {}  # código -> (sprite, metade da largura, metade da altura)
+
+    def get_sprite(self, code):
+        entry = self.cache.get(code)
+        if entry is None:
+            color = ((code >> 16) & 255, (code >> 8) & 255, code & 255)
+            rest = code >> 24
+            bucket = rest % self.alpha_buckets
+            size = (rest // self.alpha_buckets) % 64
+            kind = rest // (self.alpha_buckets * 64)
+            alpha = int(round(self.max_alpha * bucket / (self.alpha_buckets - 1)))
+
+            sprite = self.build_sprite(size, color, kind, alpha)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            sprite.set_alpha(alpha)
+            entry = self.cache[code] = (sprite, sprite.get_width() // 2, sprite.get_height() // 2)
+        return entry
+
+    def draw(self, screen, system, offset=(0, 0), visible=None):
+        """Desenhar as partículas vivas (ou só as marcadas em `visible`)"""
+        n = system.count
+        if not n:
+            return
+        ratio = system.life_ratio()
+        x = system.x[:n]
+        y = system.y[:n]
+        size = system.size[:n]
+        color = system.color[:n]
+        kind = system.kind[:n]
+        if visible is not None:
+            ratio, x, y, size, color, kind = ratio[visible], x[visible], y[visible], size[visible], color[visible], kind[visible]
+
+        # Faixa de alpha; partículas totalmente apagadas nem entram no lote
+        bucket = (ratio * (self.alpha_buckets - 1) + 0.5).astype(numpy.int64)
+        shown = bucket > 0
+        if not shown.any():
+            return
+        bucket, x, y, size, color, kind = bucket[shown], x[shown], y[shown], size[shown], color[shown], kind[shown]
+
+        # Um código inteiro por sprite: tipo, tamanho, faixa de alpha e cor RGB
+        color = color.astype(numpy.int64)
+        codes = ((kind.astype(numpy.int64) * 64 + numpy.clip(size, 0, 63)) * self.alpha_buckets + bucket) << 24
+        codes |= (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+
+        unique_codes, inverse = numpy.unique(codes, return_inverse=True)
+        entries = [self.get_sprite(code) for code in unique_codes.tolist()]
+        sprites = numpy.empty(len(entries), dtype=object)
+        sprites[:] = [entry[0] for entry in entries]
+        half_width = numpy.array([entry[1] for entry in entries])[inverse]
+        half_height = numpy.array([entry[2] for entry in entries])[inverse]
+
+        screen_x = (x - offset[0]).astype(numpy.int64) - half_width
+        screen_y = (y - offset[1]).astype(numpy.int64) - half_height
+        batch = zip(sprites[inverse].tolist(), zip(screen_x.tolist(), screen_y.tolist()))
+        if hasattr(screen, 'fblits'):
+            screen.fblits(list(batch))
+        else:
+            screen.blits(batch, doreturn=False)
@@ -0,0 +1,74 @@
+import numpy
+import pygame
+
+# Máscaras e superfícies de overlay, construídas uma vez por resolução
+_overlay_cache = {}
+
+def get_vignette(size, max_alpha=150):
+    """Máscara de vinheta: preto com alpha crescendo do centro para as bordas
+    
+    O alpha segue (distância / distância máxima)² limitado a max_alpha.
+    """
+    key = ('vignette', tuple(size), max_alpha)
+    vignette = _overlay_cache.get(key)
+    if vignette is None:
+        width, height = size
+        center_x = width // 2
+        center_y = height // 2
+        max_distance = numpy.sqrt(center_x ** 2 + center_y ** 2)
+        
+        xs = (numpy.arange(width) - center_x)[:, numpy.newaxis]
+        ys = (numpy.arange(height) - center_y)[numpy.newaxis, :]
+        distance = numpy.sqrt(xs ** 2 + ys ** 2)
+        alpha = numpy.minimum(max_alpha, (max_alpha * (distance / max_distance) ** 2).astype(numpy.int32))
+        
+        vignette = pygame.Surface((width, height), pygame.SRCALPHA)
+        vignette.fill((0, 0, 0, 0))
+        pixels = pygame.surfarray.pixels_alpha(vignette)
+        pixels[:] = alpha.astype(numpy.uint8)
+        del pixels  # Liberar o lock da superfície
+        
+        _overlay_cache[key] = vignette
+    return vignette
+
+def draw_vignette(screen, intensity=1.0, max_alpha=150):
+    """Aplicar a vinheta cacheada, modulando a força pelo alpha da superfície"""
+    vignette = get_vignette(screen.get_size(), max_alpha)
+    vignette.set_alpha(int(255 * max(0.0, min(1.0, intensity))))
+    screen.blit(vignette, (0, 0))
+
+def get_tint_surface(size, color):
+    """Superfície opaca preenchida com uma cor, reaproveitada entre quadros
+    
+    Há uma superfície por tamanho; uma cor diferente só a preenche de
+    novo, então cores que mudam a cada quadro não alocam nada.
+    """
+    key = ('tint', tuple(size))
+    entry = _overlay_cache.get(key)
+    if entry is None:
+        tint = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            tint = tint.convert()
+        entry = _overlay_cache[key] = [tint, None]
+    color = tuple(color)
+    if entry[1] != color:
+        entry[0].fill(color)
+        entry[1] = color
+    return entry[0]
+
+def draw_tint(screen, color, alpha, rect=None):
+    """Misturar uma cor sólida sobre a tela (ou uma área) com o alpha dado
+    
+    Equivale a preencher uma superfície SRCALPHA com (*color, alpha) e
+    fazer blit, mas sem alocar nada por quadro.
+    """
+    if rect is None:
+        rect = screen.get_rect()
+    else:
+        rect = pygame.Rect(rect)
+    tint = get_tint_surface(rect.size, color)
+    tint.set_alpha(max(0, min(255, int(alpha))))
+    screen.blit(tint, rect.topleft)
+
+def clear_overlay_cache():
+    _overlay_cache.clear()
\ No newline at end of file
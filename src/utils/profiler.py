@@ -0,0 +1,78 @@
+import time
+from collections import deque
+
+def percentile(sorted_values, fraction):
+    """Percentil por posição mais próxima numa lista já ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+def summarize(values):
+    """Resumo (p50/p95/p99/média/máximo) de uma lista de amostras"""
+    ordered = sorted(values)
+    return {
+        'p50': round(percentile(ordered, 0.50), 4),
+        'p95': round(percentile(ordered, 0.95), 4),
+        'p99': round(percentile(ordered, 0.99), 4),
+        'mean': round(sum(ordered) / len(ordered), 4) if ordered else 0.0,
+        'max': round(ordered[-1], 4) if ordered else 0.0
+    }
+
+class FrameProfiler:
+    """Cronometra fases nomeadas do quadro com perf_counter_ns
+
+    Cada fase guarda uma janela móvel das últimas amostras. Desligado,
+    o custo é só o teste de `enabled` feito por quem chama.
+    """
+
+    def __init__(self, window=240):
+        self.enabled = False
+        self.window = window
+        self.samples = {}  # nome da fase -> deque de tempos em ns
+        self.order = []    # fases na ordem em que apareceram
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def run(self, name, phase, *args):
+        """Executar uma fase medindo seu tempo"""
+        start = time.perf_counter_ns()
+        result = phase(*args)
+        self.record(name, time.perf_counter_ns() - start)
+        return result
+
+    def record(self, name, elapsed_ns):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self.samples[name] = samples
+            self.order.append(name)
+        samples.append(elapsed_ns)
+
+    def reset(self):
+        self.samples.clear()
+        self.order.clear()
+
+    def phase_stats(self, name):
+        """Estatísticas em milissegundos de uma fase"""
+        return summarize([ns / 1e6 for ns in self.samples.get(name, ())])
+
+    def stats(self):
+        """Estatísticas em milissegundos de todas as fases, em ordem"""
+        return {name: self.phase_stats(name) for name in self.order}
+
+    def histogram(self, name, edges_ms=(0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16)):
+        """Contagem de amostras por faixa de tempo (a última faixa é aberta)"""
+        counts = [0] * (len(edges_ms) + 1)
+        for ns in self.samples.get(name, ()):
+            ms = ns / 1e6
+            bucket = 0
+            while bucket < len(edges_ms) and ms >= edges_ms[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return counts
+
+# Profiler compartilhado pelo jogo, benchmark e overlay
+profiler = FrameProfiler()
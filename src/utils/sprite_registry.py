@@ -0,0 +1,71 @@
+import json
+import os
+from types import MappingProxyType
+import pygame
+from utils.assets_loader import get_resource_path
+from utils.asset_manager import assets
+from utils.animation_atlas import AnimationAtlas
+
+class SpriteData:
+    """Dados de um sprite compartilhados por todas as instâncias (flyweight)
+    
+    animations é somente leitura; spritesheet e frames do atlas não
+    devem ser modificados por quem os recebe.
+    """
+    
+    def __init__(self, spritesheet, animations, atlas):
+        self.spritesheet = spritesheet
+        self.animations = animations
+        self.atlas = atlas
+
+# Registro global: (arquivo de configuração, tamanho do frame) -> SpriteData
+_sprite_registry = {}
+
+def get_sprite_data(config_name, frame_size, fallback):
+    """Obter os dados do sprite, carregando JSON e spritesheet só na primeira vez"""
+    key = (config_name, tuple(frame_size))
+    sprite_data = _sprite_registry.get(key)
+    if sprite_data is None:
+        sprite_data = load_sprite_data(config_name, frame_size, fallback)
+        _sprite_registry[key] = sprite_data
+    return sprite_data
+
+def load_sprite_data(config_name, frame_size, fallback):
+    config_path = get_resource_path(os.path.join("src", "sprite", config_name))
+    
+    try:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        
+        # Carregar spritesheet (já convertido pelo gerenciador de assets)
+        spritesheet = assets.get_image(config["spriteSheet"])
+        
+        # Processar animações
+        animations = {}
+        for sprite_config in config["sprites"]:
+            animations[sprite_config["name"]] = {
+                "frames": sprite_config["frames"],
+                "frameDuration": sprite_config["frameDuration"]
+            }
+            
+    except FileNotFoundError:
+        # Fallback para uma imagem simples se não encontrar o arquivo
+        spritesheet = pygame.Surface(fallback["size"])
+        spritesheet.fill(fallback["color"])
+        animations = fallback["animations"]
+    
+    atlas = AnimationAtlas(spritesheet, animations, frame_size)
+    return SpriteData(spritesheet, freeze_animations(animations), atlas)
+
+def freeze_animations(animations):
+    """Cópia somente leitura das animações para compartilhar entre instâncias"""
+    return MappingProxyType({
+        name: MappingProxyType({
+            "frames": tuple(MappingProxyType(dict(frame)) for frame in animation["frames"]),
+            "frameDuration": animation["frameDuration"]
+        })
+        for name, animation in animations.items()
+    })
+
+def clear_sprite_registry():
+    _sprite_registry.clear()
\ No newline at end of file
@@ -0,0 +1,22 @@
+import os
+import sys
+
+# Testes sem janela: drivers dummy do SDL antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import pygame
+import pytest
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+@pytest.fixture(scope="session")
+def display():
+    """Modo de vídeo (dummy) para convert/convert_alpha"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield screen
+    pygame.quit()
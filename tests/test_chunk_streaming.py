@@ -0,0 +1,89 @@
+import json
+import os
+import pygame
+from levels.LevelData import compile_level
+from levels.Level_1 import Level_1
+from scenes.GameScene import GameScene
+from utils.assets_loader import get_resource_path
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+def widened_level(repeat=100):
+    """Level_1 repetido `repeat` vezes na horizontal, com um demon a cada 700 px"""
+    with open(get_resource_path(os.path.join("src", "levels", "data", "level_1.json"))) as f:
+        config = json.load(f)
+    rows = config["tiles"]
+    inner = len(rows[0]) - 2
+    config["tiles"] = [row[0] + row[1:-1] * repeat + row[-1] for row in rows]
+    width = (inner * repeat + 2) * config["tile_size"]
+    config["enemy_spawns"] = [[x, 600] for x in range(400, width - 400, 700)]
+    return compile_level(config)
+
+def sweep(level, positions):
+    """Mover a câmera pelas posições e guardar os maiores números de objetos vivos"""
+    peak = {"demons": 0, "chunks": 0, "colliders": 0, "active": 0}
+    for x in positions:
+        level.stream(pygame.Rect(x, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        peak["demons"] = max(peak["demons"], len(level.enemies))
+        peak["chunks"] = max(peak["chunks"], len(level.tile_layer.chunks))
+        peak["colliders"] = max(peak["colliders"], sum(len(c) for c in level.chunk_colliders.values()))
+        peak["active"] = max(peak["active"], len(level.streamer.active))
+    return peak
+
+def test_streaming_keeps_enemy_count_and_bounded_memory(display):
+    data = widened_level()
+    level = Level_1(None, data=data)
+    total = len(data.enemy_spawns)
+    assert level.remaining_enemies() == total
+
+    end = level.width - SCREEN_WIDTH
+    positions = list(range(0, end, 37)) + list(range(end, -1, -53))
+    peak = sweep(level, positions)
+    assert level.remaining_enemies() == total
+
+    # A tela cobre no máximo dois chunks de largura; com margem de 2 chunks
+    # para os tiles e 1 para os inimigos, nada cresce com o tamanho do level
+    assert peak["active"] <= 6
+    assert peak["chunks"] <= 6
+    assert peak["colliders"] <= 6 * max(len(c) for c in data.chunk_colliders.values())
+    assert peak["demons"] <= 4 * SCREEN_WIDTH // 700 + 1
+    # Objetos Demon só são criados quando o pool está vazio
+    assert len(level.free_demons) + len(level.enemies) <= peak["demons"]
+
+def test_dormant_enemy_keeps_its_state(display):
+    level = Level_1(None, data=widened_level(10))
+    level.stream(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+    demon = min(level.enemies, key=lambda enemy: enemy.rect.x)
+    spawn_order = demon.spawn_order
+    demon.take_damage(1)
+    demon.rect.x += 20
+    position = demon.rect.center
+
+    level.stream(pygame.Rect(level.width - SCREEN_WIDTH, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+    # O objeto pode ter sido reaproveitado por outro demon; o registro ficou dormente
+    assert spawn_order not in [enemy.spawn_order for enemy in level.enemies]
+    level.stream(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    (woken,) = [enemy for enemy in level.enemies if enemy.spawn_order == spawn_order]
+    assert woken.health == 2
+    assert woken.rect.center == position
+
+class NoInput:
+    """Teclado sem nenhuma tecla apertada"""
+
+    def __call__(self):
+        return self
+
+    def __getitem__(self, key):
+        return False
+
+def test_player_spawned_far_from_origin_lands_on_floor(display):
+    data = widened_level()
+    data.player_spawn = (data.width - 300, 650)
+    scene = GameScene(None, data)
+    scene.read_input = NoInput()
+    floor_top = (data.rows - 1) * data.tile_size
+
+    for _ in range(60):
+        scene.update()
+        assert scene.player.rect.bottom <= floor_top
+    assert scene.player.on_ground
@@ -0,0 +1,84 @@
+import glob
+import json
+import os
+import numpy
+from levels.LevelData import CACHE_HEADER, compile_level, load_level_file, merge_solid_tiles, read_cache
+from utils.assets_loader import get_resource_path
+
+LEVEL_1 = get_resource_path(os.path.join("src", "levels", "data", "level_1.json"))
+
+def load_config():
+    with open(LEVEL_1) as f:
+        return json.load(f)
+
+def coverage(rects, shape):
+    covered = numpy.zeros(shape, dtype=int)
+    for col, row, width, height in rects:
+        covered[row:row + height, col:col + width] += 1
+    return covered
+
+def test_merge_covers_solid_tiles_exactly_once():
+    rng = numpy.random.default_rng(1)
+    for _ in range(20):
+        solid = rng.random((12, 40)) < 0.4
+        rects = merge_solid_tiles(solid)
+        assert (coverage(rects, solid.shape) == solid).all()
+
+def test_merge_joins_rows_and_columns():
+    solid = numpy.zeros((4, 6), dtype=bool)
+    solid[3, :] = True      # chão
+    solid[:, 0] = True      # parede
+    assert sorted(merge_solid_tiles(solid)) == [(0, 0, 1, 4), (1, 3, 5, 1)]
+
+def test_level_colliders_cover_mask_and_stay_inside_chunks():
+    level = compile_level(load_config())
+    rects = [tuple(row[2:]) for row in level.colliders.tolist()]
+    assert (coverage(rects, level.tiles.shape) == (level.tiles != 0)).all()
+    # Level_1 tem 96 tiles sólidos cobertos por 15 colisores
+    assert int((level.tiles != 0).sum()) == 96
+    assert len(rects) == 15
+
+    for chunk_col, chunk_row, col, row, width, height in level.colliders.tolist():
+        first_col, last_col, first_row, last_row = level.chunk_tiles((chunk_col, chunk_row))
+        assert first_col <= col and col + width <= last_col
+        assert first_row <= row and row + height <= last_row
+
+def test_cache_round_trip(tmp_path):
+    first = load_level_file(LEVEL_1, str(tmp_path))
+    (cache_path,) = glob.glob(str(tmp_path / "level_1.*.bin"))
+    with open(cache_path, 'rb') as f:
+        cached = read_cache(f.read())
+
+    for level in (cached, load_level_file(LEVEL_1, str(tmp_path))):
+        assert (level.tiles == first.tiles).all()
+        assert (level.enemy_spawns == first.enemy_spawns).all()
+        assert (level.colliders == first.colliders).all()
+        assert level.player_spawn == first.player_spawn
+        assert level.tile_images == first.tile_images
+        assert level.background == first.background
+        assert (level.width, level.height) == (first.width, first.height)
+
+def corrupt_and_reload(tmp_path, corrupt):
+    expected = load_level_file(LEVEL_1, str(tmp_path))
+    (cache_path,) = glob.glob(str(tmp_path / "level_1.*.bin"))
+    with open(cache_path, 'rb') as f:
+        data = f.read()
+    with open(cache_path, 'wb') as f:
+        f.write(corrupt(data))
+
+    level = load_level_file(LEVEL_1, str(tmp_path))
+    assert (level.tiles == expected.tiles).all()
+    assert (level.colliders == expected.colliders).all()
+    # A recompilação regrava um cache válido
+    with open(cache_path, 'rb') as f:
+        assert f.read() == data
+
+def test_truncated_cache_recompiles(tmp_path):
+    corrupt_and_reload(tmp_path, lambda data: data[:len(data) - 10])
+
+def test_version_1_cache_recompiles(tmp_path):
+    def downgrade(data):
+        fields = list(CACHE_HEADER.unpack_from(data))
+        fields[1] = 1
+        return CACHE_HEADER.pack(*fields) + data[CACHE_HEADER.size:]
+    corrupt_and_reload(tmp_path, downgrade)